@@ -11,9 +11,13 @@ Problem Frames Spec Validator
 5. Acceptance tests 涵蓋所有 Frame Concerns
 
 Usage:
-    python validate_spec.py <spec_dir>
+    python validate_spec.py [--no-cache] <spec_dir>
     python validate_spec.py docs/specs/create-workflow/
 
+磁碟快取位於 $XDG_CACHE_HOME/knowlet-specvalidator/（預設 ~/.cache/），
+可用 --no-cache 或環境變數 SPEC_VALIDATOR_NO_CACHE=1 停用；
+超過 30 天或超出 4096 個的快取檔會自動清除。
+
 Exit codes:
     0 - All validations passed
     1 - Validation errors found
@@ -22,20 +26,193 @@ Exit codes:
 
 import sys
 import os
-import yaml
+import io
+import re
+import copy
+import json
+import mmap
+import hashlib
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+try:
+    import ahocorasick  # 選用：pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# PyYAML 延遲載入：用法錯誤等提早結束的路徑不必付出 import 成本
+yaml = None
+SafeLoader = None
+
+
+def _import_yaml():
+    """首次需要解析 YAML 時才載入 PyYAML（優先使用 libyaml 的 CSafeLoader）"""
+    global yaml, SafeLoader
+    if yaml is None:
+        import yaml as _yaml
+        try:
+            from yaml import CSafeLoader as _SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as _SafeLoader
+        yaml, SafeLoader = _yaml, _SafeLoader
+    return yaml
+
+
+# 以內容雜湊為 key 的 YAML 解析快取（process 內共用，LRU 淘汰）
+_YAML_CACHE_SIZE = 512
+_yaml_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
+def _parse_yaml_cached(path: Path) -> Any:
+    """解析 YAML 檔案；內容相同的檔案只解析一次"""
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空檔案無法 mmap，等同 yaml.load(b"")
+            return None
+        with mm:
+            digest = hashlib.blake2b(mm, digest_size=16).digest()
+            with _yaml_cache_lock:
+                if digest in _yaml_cache:
+                    _yaml_cache.move_to_end(digest)
+                    return _yaml_cache[digest]
+            _import_yaml()
+            # 具名 stream：語法錯誤訊息才會標示檔名而非 "<byte string>"
+            stream = io.BytesIO(mm[:])
+            stream.name = str(path)
+            data = yaml.load(stream, Loader=SafeLoader)
+    
+    with _yaml_cache_lock:
+        _yaml_cache[digest] = data
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return data
+
 
-@dataclass
+# 跨執行的磁碟快取：YAML 未變更（mtime + size 相同）時直接讀取 JSON
+# --no-cache 停用磁碟快取（環境變數 SPEC_VALIDATOR_NO_CACHE=1 亦可）
+_disk_cache_disabled = False
+# 超過保存期限或數量上限的快取檔會在執行結束時清除
+_DISK_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # 秒
+_DISK_CACHE_MAX_ENTRIES = 4096
+
+
+def _disk_cache_dir() -> Optional[Path]:
+    """磁碟快取目錄；每次呼叫時才讀取環境變數，停用時回傳 None"""
+    if _disk_cache_disabled or os.environ.get("SPEC_VALIDATOR_NO_CACHE"):
+        return None
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        / "knowlet-specvalidator"
+    )
+
+
+def _load_yaml_with_disk_cache(path: Path, stamp: Tuple[int, int]) -> Any:
+    """載入 YAML 檔案，優先使用磁碟上的 JSON 快取
+    
+    stamp 為呼叫端已取得的 (mtime_ns, size)，避免重複 stat。
+    """
+    cache_dir = _disk_cache_dir()
+    if cache_dir is None:
+        return _parse_yaml_cached(path)
+    
+    stamp = list(stamp)
+    key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = json.loads(f.read())
+        if cached.get("stamp") == stamp:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    data = _parse_yaml_cached(path)
+    _write_disk_cache(cache_file, stamp, data)
+    return data
+
+
+def _prune_disk_cache(now: Optional[float] = None):
+    """刪除過期的快取檔，並只保留最近寫入的 _DISK_CACHE_MAX_ENTRIES 個"""
+    cache_dir = _disk_cache_dir()
+    if cache_dir is None:
+        return
+    now = time.time() if now is None else now
+    
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return
+    
+    entries.sort(reverse=True)
+    for i, (mtime, cache_path) in enumerate(entries):
+        if i >= _DISK_CACHE_MAX_ENTRIES or now - mtime > _DISK_CACHE_MAX_AGE:
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+
+
+def _write_disk_cache(cache_file: Path, stamp: List[int], data: Any):
+    """以 os.replace 原子寫入快取；無法以 JSON 無損表示的內容不快取"""
+    try:
+        payload = json.dumps(
+            {"stamp": stamp, "data": data}, ensure_ascii=False
+        ).encode('utf-8')
+    except (TypeError, ValueError):
+        # 例如 YAML 的 date/timestamp 型別
+        return
+    if json.loads(payload)["data"] != data:
+        # 例如非字串的 mapping key 會被 JSON 轉成字串
+        return
+    
+    tmp_file = cache_file.with_name(
+        f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # 快取只是加速用途，寫入失敗（唯讀家目錄等）不影響驗證
+        pass
+
+
+def _build_keyword_automaton(keywords):
+    """建立多關鍵字比對的 Aho-Corasick automaton；未安裝 pyahocorasick 時回傳 None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(slots=True)
 class ValidationError:
     file: str
     message: str
     severity: str = "error"  # error | warning
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     errors: List[ValidationError] = field(default_factory=list)
     warnings: List[ValidationError] = field(default_factory=list)
@@ -49,14 +226,31 @@ class ValidationResult:
     
     def add_warning(self, file: str, message: str):
         self.warnings.append(ValidationError(file, message, "warning"))
+    
+    def merge(self, other: "ValidationResult"):
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
 
 
 class SpecValidator:
     """Problem Frames 規格驗證器"""
     
-    REQUIRED_FILES = [
+    __slots__ = (
+        "spec_dir",
+        "result",
+        "frame_data",
+        "_entries",
+        "_subdir_entries",
+        "_parsed",
+        "_frame_path",
+        "_aggregate_path",
+        "_acceptance_path",
+        "_legacy_acceptance_path",
+    )
+    
+    REQUIRED_FILES = frozenset({
         "frame.yaml",
-    ]
+    })
     
     OPTIONAL_DIRECTORIES = [
         "requirements",
@@ -67,25 +261,69 @@ class SpecValidator:
         "runbook",
     ]
     
-    VALID_FRAME_TYPES = [
+    _FRAME_TYPES = (
         "CommandedBehaviorFrame",
         "InformationDisplayFrame",
         "RequiredBehaviorFrame",
         "WorkpiecesFrame",
         "TransformationFrame",
-    ]
+    )
+    VALID_FRAME_TYPES = frozenset(_FRAME_TYPES)
+    _VALID_FRAME_TYPES_DISPLAY = ", ".join(_FRAME_TYPES)
+    
+    # frame.yaml 的必要欄位與建議區段（tuple 保留回報順序）
+    REQUIRED_FRAME_FIELDS = ("problem_frame", "frame_type", "intent")
+    RECOMMENDED_FRAME_SECTIONS = ("operator", "machine", "controlled_domain")
+    _REQUIRED_FRAME_FIELD_SET = frozenset(REQUIRED_FRAME_FIELDS)
+    _RECOMMENDED_FRAME_SECTION_SET = frozenset(RECOMMENDED_FRAME_SECTIONS)
+    
+    # 需求描述中不應出現的實作細節關鍵字
+    IMPLEMENTATION_KEYWORDS = (
+        "class", "function", "method", "interface",
+        "repository", "controller", "service", "handler",
+    )
+    # 以 lookahead 在每個位置比對，重疊的關鍵字（如 "classervice"）也都會找到
+    _IMPL_RE = re.compile(
+        "(?=(" + "|".join(IMPLEMENTATION_KEYWORDS) + "))", re.IGNORECASE
+    )
+    _IMPL_AUTOMATON = _build_keyword_automaton(IMPLEMENTATION_KEYWORDS)
+    
+    # 讀取互不相關檔案的驗證步驟，可並行執行
+    PARALLEL_STEPS = (
+        "_validate_requirements",
+        "_validate_machine",
+        "_validate_controlled_domain",
+        "_validate_acceptance",
+    )
     
     def __init__(self, spec_dir: Path):
         self.spec_dir = spec_dir
         self.result = ValidationResult()
         self.frame_data: Optional[Dict[str, Any]] = None
+        # 目錄快照：以一次 scandir 取代逐一 Path.exists() 的 stat
+        self._entries: Dict[str, os.DirEntry] = {}
+        self._subdir_entries: Dict[str, Dict[str, os.DirEntry]] = {}
+        # 已解析的 YAML：path -> ((mtime_ns, size), data)，跨多次 validate() 保留
+        self._parsed: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+        # 固定位置的規格檔案
+        self._frame_path = spec_dir / "frame.yaml"
+        self._aggregate_path = spec_dir / "controlled-domain" / "aggregate.yaml"
+        self._acceptance_path = spec_dir / "acceptance.yaml"
+        self._legacy_acceptance_path = spec_dir / "acceptance" / "acceptance.yaml"
     
     def validate(self) -> ValidationResult:
-        """執行完整驗證"""
+        """執行完整驗證（可重複呼叫，例如 watch mode）"""
+        _import_yaml()
+        self.result = ValidationResult()
+        self.frame_data = None
+        self._entries = {}
+        self._subdir_entries = {}
+        
         self._check_directory_exists()
-        if not self.result.is_valid:
+        if self.result.errors:
             return self.result
         
+        self._entries = self._scan(self.spec_dir)
         self._check_required_files()
         self._load_frame_yaml()
         
@@ -93,13 +331,21 @@ class SpecValidator:
             self._validate_frame_yaml()
             self._validate_frame_concerns()
             self._validate_cross_context()
-            self._validate_requirements()
-            self._validate_machine()
-            self._validate_controlled_domain()
-            self._validate_acceptance()
+            
+            # 各步驟收集自己的結果，再依原順序合併，輸出維持穩定
+            with ThreadPoolExecutor(max_workers=len(self.PARALLEL_STEPS)) as pool:
+                for step_result in pool.map(self._run_isolated, self.PARALLEL_STEPS):
+                    self.result.merge(step_result)
         
         return self.result
     
+    def _run_isolated(self, step: str) -> ValidationResult:
+        """在淺拷貝上執行驗證步驟（共用快照與解析快取，結果獨立）"""
+        worker = copy.copy(self)
+        worker.result = ValidationResult()
+        getattr(worker, step)()
+        return worker.result
+    
     def _check_directory_exists(self):
         """檢查規格目錄是否存在"""
         if not self.spec_dir.exists():
@@ -113,11 +359,55 @@ class SpecValidator:
                 f"Path is not a directory: {self.spec_dir}"
             )
     
+    @staticmethod
+    def _scan(directory: Path) -> Dict[str, os.DirEntry]:
+        """以單次 scandir 列出目錄內容"""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry for entry in it}
+        except OSError:
+            return {}
+    
+    def _subdir(self, name: str) -> Dict[str, os.DirEntry]:
+        """取得子目錄的快照（首次使用時才 scandir）"""
+        entries = self._subdir_entries.get(name)
+        if entries is None:
+            entry = self._entries.get(name)
+            if entry is not None and entry.is_dir():
+                entries = self._scan(Path(entry.path))
+            else:
+                entries = {}
+            self._subdir_entries[name] = entries
+        return entries
+    
+    def _exists(self, rel_path: str) -> bool:
+        """判斷 spec_dir 下的相對路徑是否存在"""
+        parts = Path(rel_path).parts
+        if Path(rel_path).is_absolute() or os.pardir in parts or len(parts) > 2:
+            # 快照只涵蓋 spec_dir 與其直接子目錄
+            return (self.spec_dir / rel_path).exists()
+        if len(parts) == 1:
+            return parts[0] in self._entries
+        if len(parts) == 2:
+            return parts[1] in self._subdir(parts[0])
+        return True  # 空路徑即 spec_dir 本身
+    
+    def _load(self, path: Path) -> Any:
+        """載入 YAML；檔案未變更時直接沿用上次的解析結果"""
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._parsed.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        data = _load_yaml_with_disk_cache(path, stamp)
+        self._parsed[path] = (stamp, data)
+        return data
+    
     def _check_required_files(self):
         """檢查必要檔案是否存在"""
-        for file in self.REQUIRED_FILES:
-            file_path = self.spec_dir / file
-            if not file_path.exists():
+        for file in sorted(self.REQUIRED_FILES):
+            if file not in self._entries:
                 self.result.add_error(
                     file,
                     f"Required file missing: {file}"
@@ -125,13 +415,11 @@ class SpecValidator:
     
     def _load_frame_yaml(self):
         """載入 frame.yaml"""
-        frame_path = self.spec_dir / "frame.yaml"
-        if not frame_path.exists():
+        if "frame.yaml" not in self._entries:
             return
         
         try:
-            with open(frame_path, 'r', encoding='utf-8') as f:
-                self.frame_data = yaml.safe_load(f)
+            self.frame_data = self._load(self._frame_path)
         except yaml.YAMLError as e:
             self.result.add_error(
                 "frame.yaml",
@@ -143,14 +431,17 @@ class SpecValidator:
         if not self.frame_data:
             return
         
+        keys = self.frame_data.keys()
+        
         # 檢查必要欄位
-        required_fields = ["problem_frame", "frame_type", "intent"]
-        for field in required_fields:
-            if field not in self.frame_data:
-                self.result.add_error(
-                    "frame.yaml",
-                    f"Missing required field: {field}"
-                )
+        missing_fields = self._REQUIRED_FRAME_FIELD_SET - keys
+        if missing_fields:
+            for field in self.REQUIRED_FRAME_FIELDS:
+                if field in missing_fields:
+                    self.result.add_error(
+                        "frame.yaml",
+                        f"Missing required field: {field}"
+                    )
         
         # 驗證 frame_type
         frame_type = self.frame_data.get("frame_type")
@@ -158,29 +449,18 @@ class SpecValidator:
             self.result.add_error(
                 "frame.yaml",
                 f"Invalid frame_type: {frame_type}. "
-                f"Valid types: {', '.join(self.VALID_FRAME_TYPES)}"
-            )
-        
-        # 檢查 operator
-        if "operator" not in self.frame_data:
-            self.result.add_warning(
-                "frame.yaml",
-                "Missing 'operator' section"
+                f"Valid types: {self._VALID_FRAME_TYPES_DISPLAY}"
             )
         
-        # 檢查 machine
-        if "machine" not in self.frame_data:
-            self.result.add_warning(
-                "frame.yaml",
-                "Missing 'machine' section"
-            )
-        
-        # 檢查 controlled_domain
-        if "controlled_domain" not in self.frame_data:
-            self.result.add_warning(
-                "frame.yaml",
-                "Missing 'controlled_domain' section"
-            )
+        # 檢查 operator / machine / controlled_domain
+        missing_sections = self._RECOMMENDED_FRAME_SECTION_SET - keys
+        if missing_sections:
+            for section in self.RECOMMENDED_FRAME_SECTIONS:
+                if section in missing_sections:
+                    self.result.add_warning(
+                        "frame.yaml",
+                        f"Missing '{section}' section"
+                    )
     
     def _validate_frame_concerns(self):
         """驗證 Frame Concerns 的 satisfied_by 連結"""
@@ -196,6 +476,15 @@ class SpecValidator:
             )
             return
         
+        # 先收集所有連結指向的檔案，每個檔案只查詢一次目錄快照
+        link_files = {
+            self._link_file(link)
+            for fc in frame_concerns
+            for link in fc.get("satisfied_by") or ()
+        }
+        link_files.discard(None)
+        file_exists = {part: self._exists(part) for part in link_files}
+        
         for fc in frame_concerns:
             fc_id = fc.get("id", "unknown")
             
@@ -222,22 +511,22 @@ class SpecValidator:
             else:
                 # 驗證 satisfied_by 連結的檔案存在
                 for link in satisfied_by:
-                    self._validate_satisfied_by_link(fc_id, link)
+                    self._validate_satisfied_by_link(fc_id, link, file_exists)
     
-    def _validate_satisfied_by_link(self, fc_id: str, link: str):
-        """驗證 satisfied_by 連結"""
+    @staticmethod
+    def _link_file(link: str) -> Optional[str]:
+        """取出 satisfied_by 連結的檔案部分；測試連結回傳 None"""
         # 格式: file.yaml#section 或 tests#test-id
         if link.startswith("tests#"):
             # 測試連結，稍後在 acceptance 驗證
-            return
-        
-        if "#" in link:
-            file_part, section = link.split("#", 1)
-        else:
-            file_part = link
-        
-        file_path = self.spec_dir / file_part
-        if not file_path.exists():
+            return None
+        return link.split("#", 1)[0]
+    
+    def _validate_satisfied_by_link(self, fc_id: str, link: str,
+                                    file_exists: Dict[str, bool]):
+        """驗證 satisfied_by 連結"""
+        file_part = self._link_file(link)
+        if file_part is not None and not file_exists[file_part]:
             self.result.add_warning(
                 "frame.yaml",
                 f"Frame concern {fc_id}: satisfied_by file not found: {file_part}"
@@ -249,7 +538,6 @@ class SpecValidator:
             return
         
         cross_context_deps = self.frame_data.get("cross_context_dependencies", [])
-        cross_context_dir = self.spec_dir / "cross-context"
         
         for xc in cross_context_deps:
             xc_id = xc.get("id", "unknown")
@@ -271,8 +559,7 @@ class SpecValidator:
             # 檢查對應的 ACL 規格檔案
             contract_spec = xc.get("contract_spec")
             if contract_spec:
-                spec_path = self.spec_dir / contract_spec
-                if not spec_path.exists():
+                if not self._exists(contract_spec):
                     self.result.add_error(
                         "frame.yaml",
                         f"Cross-context {xc_id}: ACL spec file not found: {contract_spec}"
@@ -280,8 +567,8 @@ class SpecValidator:
             else:
                 # 嘗試找預設位置
                 default_name = xc_name.lower().replace(" ", "-")
-                default_path = cross_context_dir / f"{default_name}.yaml"
-                if cross_context_dir.exists() and not default_path.exists():
+                if ("cross-context" in self._entries
+                        and f"{default_name}.yaml" not in self._subdir("cross-context")):
                     self.result.add_warning(
                         "frame.yaml",
                         f"Cross-context {xc_id}: No ACL spec file found, "
@@ -290,15 +577,18 @@ class SpecValidator:
     
     def _validate_requirements(self):
         """驗證需求層"""
-        req_dir = self.spec_dir / "requirements"
-        if not req_dir.exists():
+        if "requirements" not in self._entries:
             self.result.add_warning(
                 "requirements/",
                 "Requirements directory not found"
             )
             return
         
-        yaml_files = list(req_dir.glob("*.yaml")) + list(req_dir.glob("*.yml"))
+        yaml_files = [
+            Path(entry.path)
+            for name, entry in sorted(self._subdir("requirements").items())
+            if name.endswith((".yaml", ".yml")) and entry.is_file()
+        ]
         if not yaml_files:
             self.result.add_warning(
                 "requirements/",
@@ -311,12 +601,12 @@ class SpecValidator:
     
     def _validate_requirement_file(self, file_path: Path):
         """驗證單個需求檔案"""
+        file_name = file_path.name
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load(file_path)
         except yaml.YAMLError as e:
             self.result.add_error(
-                str(file_path.name),
+                file_name,
                 f"Invalid YAML syntax: {e}"
             )
             return
@@ -326,24 +616,25 @@ class SpecValidator:
         
         req = data.get("requirement", data)
         
-        # 檢查是否有實作細節（不應該有）
-        implementation_keywords = [
-            "class", "function", "method", "interface",
-            "repository", "controller", "service", "handler"
-        ]
-        
-        description = str(req.get("description", "")).lower()
-        for keyword in implementation_keywords:
-            if keyword in description:
+        # 檢查是否有實作細節（不應該有）：單次掃描，依關鍵字順序回報
+        found = self._find_impl_keywords(str(req.get("description", "")))
+        for keyword in self.IMPLEMENTATION_KEYWORDS:
+            if keyword in found:
                 self.result.add_warning(
-                    str(file_path.name),
+                    file_name,
                     f"Requirement description may contain implementation details: '{keyword}'"
                 )
     
+    @classmethod
+    def _find_impl_keywords(cls, description: str) -> set:
+        """回傳描述中出現的實作關鍵字（不分大小寫，含重疊出現者）"""
+        if cls._IMPL_AUTOMATON is not None:
+            return {kw for _, kw in cls._IMPL_AUTOMATON.iter(description.lower())}
+        return {m.group(1).lower() for m in cls._IMPL_RE.finditer(description)}
+    
     def _validate_machine(self):
         """驗證機器層"""
-        machine_dir = self.spec_dir / "machine"
-        if not machine_dir.exists():
+        if "machine" not in self._entries:
             self.result.add_warning(
                 "machine/",
                 "Machine directory not found"
@@ -363,9 +654,9 @@ class SpecValidator:
         }
         
         if frame_type in expected_files:
+            machine_entries = self._subdir("machine")
             for expected in expected_files[frame_type]:
-                file_path = machine_dir / expected
-                if not file_path.exists():
+                if expected not in machine_entries:
                     self.result.add_warning(
                         f"machine/{expected}",
                         f"Expected machine spec file for {frame_type}: {expected}"
@@ -373,16 +664,14 @@ class SpecValidator:
     
     def _validate_controlled_domain(self):
         """驗證領域層"""
-        domain_dir = self.spec_dir / "controlled-domain"
-        if not domain_dir.exists():
+        if "controlled-domain" not in self._entries:
             self.result.add_warning(
                 "controlled-domain/",
                 "Controlled-domain directory not found"
             )
             return
         
-        aggregate_file = domain_dir / "aggregate.yaml"
-        if not aggregate_file.exists():
+        if "aggregate.yaml" not in self._subdir("controlled-domain"):
             self.result.add_warning(
                 "controlled-domain/aggregate.yaml",
                 "Aggregate specification not found"
@@ -391,8 +680,7 @@ class SpecValidator:
         
         # 驗證 aggregate.yaml 內容
         try:
-            with open(aggregate_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load(self._aggregate_path)
         except yaml.YAMLError as e:
             self.result.add_error(
                 "controlled-domain/aggregate.yaml",
@@ -412,28 +700,26 @@ class SpecValidator:
     def _validate_acceptance(self):
         """驗證驗收測試"""
         # 新結構：acceptance.yaml 在根目錄
-        acceptance_file = self.spec_dir / "acceptance.yaml"
-        
+        if "acceptance.yaml" in self._entries:
+            acceptance_file = self._acceptance_path
         # 向下相容：也支援舊結構 acceptance/acceptance.yaml
-        if not acceptance_file.exists():
-            acceptance_dir = self.spec_dir / "acceptance"
-            if acceptance_dir.exists():
-                acceptance_file = acceptance_dir / "acceptance.yaml"
-        
-        if not acceptance_file.exists():
+        elif "acceptance.yaml" in self._subdir("acceptance"):
+            acceptance_file = self._legacy_acceptance_path
+        else:
             self.result.add_warning(
                 "acceptance.yaml",
                 "Acceptance specification not found (expected at root level)"
             )
             return
         
+        acc_key = str(acceptance_file.relative_to(self.spec_dir))
+        
         # 驗證 acceptance.yaml
         try:
-            with open(acceptance_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load(acceptance_file)
         except yaml.YAMLError as e:
             self.result.add_error(
-                str(acceptance_file.relative_to(self.spec_dir)),
+                acc_key,
                 f"Invalid YAML syntax: {e}"
             )
             return
@@ -449,7 +735,7 @@ class SpecValidator:
         
         if not acceptance_criteria:
             self.result.add_warning(
-                str(acceptance_file.relative_to(self.spec_dir)),
+                acc_key,
                 "No acceptance criteria (scenarios) defined"
             )
             return
@@ -458,7 +744,7 @@ class SpecValidator:
         types = [s.get("type") for s in acceptance_criteria]
         if "business" not in types and "happy-path" not in types:
             self.result.add_warning(
-                str(acceptance_file.relative_to(self.spec_dir)),
+                acc_key,
                 "No business (happy-path) scenario defined"
             )
         
@@ -469,14 +755,14 @@ class SpecValidator:
             # 檢查 trace 連結
             if "trace" not in ac:
                 self.result.add_warning(
-                    str(acceptance_file.relative_to(self.spec_dir)),
+                    acc_key,
                     f"Acceptance criteria {ac_id} missing 'trace' links to requirements/frame_concerns"
                 )
             
             # 檢查 given/when/then 格式
             if "given" not in ac or "when" not in ac or "then" not in ac:
                 self.result.add_warning(
-                    str(acceptance_file.relative_to(self.spec_dir)),
+                    acc_key,
                     f"Acceptance criteria {ac_id} missing given/when/then structure"
                 )
         
@@ -488,66 +774,78 @@ class SpecValidator:
             validated_concerns = set()
             for ac in acceptance_criteria:
                 # 新格式：trace.frame_concerns
-                trace = ac.get("trace", {})
-                for fc in trace.get("frame_concerns", []):
-                    validated_concerns.add(fc)
-                
+                trace = ac.get("trace") or {}
+                validated_concerns.update(trace.get("frame_concerns") or ())
                 # 舊格式：validates_concerns
-                for vc in ac.get("validates_concerns", []):
-                    validated_concerns.add(vc)
+                validated_concerns.update(ac.get("validates_concerns") or ())
             
             missing = fc_ids - validated_concerns
             if missing:
                 self.result.add_warning(
-                    str(acceptance_file.relative_to(self.spec_dir)),
+                    acc_key,
                     f"Frame concerns not covered by tests: {', '.join(missing)}"
                 )
 
 
+# 報告分隔線
+_EQ = "=" * 60
+_DASH = "-" * 40
+
+
 def print_result(result: ValidationResult, spec_dir: Path):
-    """輸出驗證結果"""
-    print(f"\n{'='*60}")
-    print(f"Problem Frames Spec Validation: {spec_dir}")
-    print(f"{'='*60}\n")
+    """輸出驗證結果（組成完整報告後一次寫出）"""
+    lines = [
+        "",
+        _EQ,
+        f"Problem Frames Spec Validation: {spec_dir}",
+        _EQ,
+        "",
+    ]
     
     if result.errors:
-        print(f"❌ ERRORS ({len(result.errors)}):")
-        print("-" * 40)
-        for err in result.errors:
-            print(f"  [{err.file}] {err.message}")
-        print()
+        lines.append(f"❌ ERRORS ({len(result.errors)}):")
+        lines.append(_DASH)
+        lines.extend(f"  [{err.file}] {err.message}" for err in result.errors)
+        lines.append("")
     
     if result.warnings:
-        print(f"⚠️  WARNINGS ({len(result.warnings)}):")
-        print("-" * 40)
-        for warn in result.warnings:
-            print(f"  [{warn.file}] {warn.message}")
-        print()
-    
-    if result.is_valid:
-        if result.warnings:
-            print(f"✅ Validation PASSED with {len(result.warnings)} warning(s)")
-        else:
-            print("✅ Validation PASSED - All checks OK")
+        lines.append(f"⚠️  WARNINGS ({len(result.warnings)}):")
+        lines.append(_DASH)
+        lines.extend(f"  [{warn.file}] {warn.message}" for warn in result.warnings)
+        lines.append("")
+    
+    if result.errors:
+        lines.append(f"❌ Validation FAILED with {len(result.errors)} error(s)")
+    elif result.warnings:
+        lines.append(f"✅ Validation PASSED with {len(result.warnings)} warning(s)")
     else:
-        print(f"❌ Validation FAILED with {len(result.errors)} error(s)")
+        lines.append("✅ Validation PASSED - All checks OK")
     
-    print()
-    return 0 if result.is_valid else 1
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return 1 if result.errors else 0
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_spec.py <spec_dir>")
+    global _disk_cache_disabled
+    args = sys.argv[1:]
+    if "--no-cache" in args:
+        args.remove("--no-cache")
+        _disk_cache_disabled = True
+    
+    if not args:
+        print("Usage: python validate_spec.py [--no-cache] <spec_dir>")
         print("Example: python validate_spec.py docs/specs/create-workflow/")
         sys.exit(2)
     
-    spec_dir = Path(sys.argv[1])
+    spec_dir = Path(args[0])
     
     validator = SpecValidator(spec_dir)
     result = validator.validate()
     
     exit_code = print_result(result, spec_dir)
+    _prune_disk_cache()
     sys.exit(exit_code)
 
 
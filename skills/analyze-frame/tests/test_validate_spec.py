@@ -0,0 +1,107 @@
+"""validate_spec.py 的單元測試
+
+執行：python -m unittest discover -s skills/analyze-frame/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import validate_spec  # noqa: E402
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.root / "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("SPEC_VALIDATOR_NO_CACHE", None)
+        self.cache_dir = self.root / "cache" / "knowlet-specvalidator"
+
+    def _stamp(self, path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def test_cache_dir_follows_environment_at_call_time(self):
+        spec = self.root / "frame.yaml"
+        spec.write_text("frame_type: CommandedBehaviorFrame\n")
+
+        data = validate_spec._load_yaml_with_disk_cache(spec, self._stamp(spec))
+
+        self.assertEqual(data, {"frame_type": "CommandedBehaviorFrame"})
+        self.assertEqual(len(list(self.cache_dir.glob("*.json"))), 1)
+
+    def test_no_cache_env_skips_disk_cache(self):
+        spec = self.root / "frame.yaml"
+        spec.write_text("a: 1\n")
+        os.environ["SPEC_VALIDATOR_NO_CACHE"] = "1"
+
+        validate_spec._load_yaml_with_disk_cache(spec, self._stamp(spec))
+
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_prune_removes_expired_and_excess_entries(self):
+        self.cache_dir.mkdir(parents=True)
+        now = 10_000_000.0
+        for i in range(5):
+            entry = self.cache_dir / f"{i}.json"
+            entry.write_text("{}")
+            os.utime(entry, (now - i, now - i))
+        expired = self.cache_dir / "old.json"
+        expired.write_text("{}")
+        old = now - validate_spec._DISK_CACHE_MAX_AGE - 1
+        os.utime(expired, (old, old))
+
+        with mock.patch.object(validate_spec, "_DISK_CACHE_MAX_ENTRIES", 3):
+            validate_spec._prune_disk_cache(now=now)
+
+        remaining = sorted(p.name for p in self.cache_dir.iterdir())
+        self.assertEqual(remaining, ["0.json", "1.json", "2.json"])
+
+
+class ImplementationKeywordTest(unittest.TestCase):
+    CASES = [
+        "The user creates a workflow",
+        "Classervice handles it",
+        "A Repository-backed controllerHandler method",
+        "functional interfaces",
+    ]
+
+    @staticmethod
+    def _expected(description):
+        # 基準行為：逐一檢查每個關鍵字是否出現
+        lowered = description.lower()
+        return {kw for kw in validate_spec.SpecValidator.IMPLEMENTATION_KEYWORDS if kw in lowered}
+
+    def _check(self):
+        for description in self.CASES:
+            with self.subTest(description=description):
+                self.assertEqual(
+                    validate_spec.SpecValidator._find_impl_keywords(description),
+                    self._expected(description),
+                )
+
+    def test_regex_path_reports_overlapping_keywords(self):
+        with mock.patch.object(validate_spec.SpecValidator, "_IMPL_AUTOMATON", None):
+            self._check()
+            self.assertEqual(
+                validate_spec.SpecValidator._find_impl_keywords("classervice"),
+                {"class", "service"},
+            )
+
+    @unittest.skipIf(validate_spec.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_path_matches_regex_path(self):
+        self.assertIsNotNone(validate_spec.SpecValidator._IMPL_AUTOMATON)
+        self._check()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,16 @@ Acceptance Test Generator
 支援新格式 (acceptance_criteria) 和舊格式 (scenarios)。
 
 Usage:
-    python generate_tests.py <spec_dir> --lang <language> [--output <dir>]
+    python generate_tests.py <spec_dir> --lang <language>... [--output <dir>] [--force]
+    python generate_tests.py --specs-root <dir> --lang <language>... --output <dir>
     python generate_tests.py docs/specs/create-workflow/ --lang typescript
     python generate_tests.py docs/specs/create-workflow/ --lang go --output tests/acceptance/
+    python generate_tests.py docs/specs/create-workflow/ --lang gherkin typescript go rust --output tests/acceptance/
+    python generate_tests.py --specs-root docs/specs/ --lang gherkin go --output tests/acceptance/
+
+Outputs carry a spec-sha256 header; with --output, an existing file whose
+header matches the current acceptance.yaml is left untouched (use --force
+to regenerate anyway).
 
 Supported languages:
     - gherkin: Generate .feature file
@@ -25,12 +32,91 @@ Exit codes:
 
 import sys
 import os
+import io
+import re
 import yaml
 import argparse
+import functools
+import concurrent.futures
+import hashlib
+import itertools
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable, Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Prefer libyaml's C loader; fall back to the pure-Python one
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Step placeholders like <boardId>
+_PLACEHOLDER_RE = re.compile(r'<(\w+)>')
+_NON_IDENT_RE = re.compile(r'[^a-zA-Z0-9]')
+# Feature-name word separators, mapped to spaces for str.title()
+_SEP_TRANS = str.maketrans("-_", "  ")
+
+OUTPUT_BUFFER_SIZE = 128 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_step(step_text: str) -> Tuple[Tuple[str, ...], str]:
+    """Return (placeholders, pattern) with each <placeholder> replaced by {string}"""
+    placeholders: List[str] = []
+    
+    def collect(match: "re.Match[str]") -> str:
+        placeholders.append(match.group(1))
+        return '{string}'
+    
+    # One scan both collects placeholder names and builds the pattern
+    pattern = _PLACEHOLDER_RE.sub(collect, step_text)
+    return tuple(placeholders), pattern
+
+
+# Precompiled render templates: static fragments interleaved with dynamic
+# fields, len(statics) == len(values) + 1
+_GHERKIN_SCENARIO_STATICS = ("  ", "", "\n  ", ": ", "")
+_GINKGO_DESCRIBE_STATICS = (
+    "    // Trace: ",
+    "\n    // Frame Concerns: ",
+    '\n    Describe("Scenario: ',
+    '", Label(',
+    "), func() {",
+)
+
+
+# Step definition skeletons, formatted once per step
+_TS_STEP_TMPL = (
+    "{step_type}(\n"
+    "  '{pattern}',\n"
+    "  function(this: World{params}) {{\n"
+    "    // TODO: Implement step - {step_text}\n"
+    "    throw new Error('Step not implemented');\n"
+    "  }}\n"
+    ");"
+)
+_RUST_STEP_TMPL = (
+    "#[{step_type}({expr})]\n"
+    "async fn {func_name}(world: &mut {world_type}{params}) {{\n"
+    "    // TODO: Implement step\n"
+    "    todo!()\n"
+    "}}"
+)
+
+# Trailing newline leaves the blank line that separates It blocks
+_GINKGO_IT_TMPL = (
+    '            It("{t}", func() {{\n'
+    '                // TODO: Implement assertion\n'
+    '                Expect(true).To(BeTrue())\n'
+    '            }})\n'
+)
+
+
+def _render(statics: Tuple[str, ...], values: Iterable[Any]) -> str:
+    """Zip static fragments with dynamic values into a single string
+    
+    Values are passed through str() as an f-string would, since YAML may
+    hand us ints or None (e.g. ``name: 404``).
+    """
+    return "".join(itertools.chain.from_iterable(zip(statics, map(str, values)))) + statics[-1]
 
 
 @dataclass
@@ -57,9 +143,11 @@ class AcceptanceParser:
         self.feature_name = spec_dir.name
         self.criteria: List[AcceptanceCriteria] = []
         self.raw_data: Dict[str, Any] = {}
+        # Hash-consed clause lists: equal clause sequences share one list object
+        self._clause_pool: Dict[Tuple[str, ...], List[str]] = {}
     
-    def parse(self) -> bool:
-        """Parse acceptance.yaml file"""
+    def find_acceptance_file(self) -> Optional[Path]:
+        """Locate acceptance.yaml in the spec directory"""
         # Try new location first (root level)
         acceptance_file = self.spec_dir / "acceptance.yaml"
         
@@ -68,15 +156,38 @@ class AcceptanceParser:
             acceptance_file = self.spec_dir / "acceptance" / "acceptance.yaml"
         
         if not acceptance_file.exists():
+            return None
+        return acceptance_file
+    
+    def parse(self, data: Optional[bytes] = None) -> bool:
+        """Parse acceptance.yaml file
+        
+        data may carry the file contents already read by the caller.
+        """
+        acceptance_file = self.find_acceptance_file()
+        if acceptance_file is None:
             print(f"ERROR: acceptance.yaml not found in {self.spec_dir}", file=sys.stderr)
             return False
         
+        if data is None:
+            data = acceptance_file.read_bytes()
+        
+        # Cheap byte-level sniff before handing the file to the YAML parser
+        if not data or data.isspace():
+            print(f"ERROR: {acceptance_file} is empty", file=sys.stderr)
+            return False
+        if b"acceptance_criteria" not in data and b"scenarios" not in data:
+            print(f"ERROR: No acceptance_criteria or scenarios found in {acceptance_file}", file=sys.stderr)
+            return False
+        
         try:
-            with open(acceptance_file, 'r', encoding='utf-8') as f:
-                self.raw_data = yaml.safe_load(f)
+            self.raw_data = yaml.load(data, Loader=SafeLoader)
         except yaml.YAMLError as e:
             print(f"ERROR: Invalid YAML in {acceptance_file}: {e}", file=sys.stderr)
             return False
+        if not isinstance(self.raw_data, dict):
+            print(f"ERROR: {acceptance_file} must contain a mapping at the top level", file=sys.stderr)
+            return False
         
         self._parse_criteria()
         return len(self.criteria) > 0
@@ -91,6 +202,7 @@ class AcceptanceParser:
             acceptance = self.raw_data.get("acceptance", {})
             criteria_list = acceptance.get("scenarios", [])
         
+        self.criteria = []
         for item in criteria_list:
             ac = self._parse_single_criteria(item)
             if ac:
@@ -147,95 +259,169 @@ class AcceptanceParser:
                 # Old format: {"condition": "...", "setup": "..."}
                 text = clause.get("condition") or clause.get("action") or clause.get("expectation", "")
                 if text:
-                    result.append(text)
-        return result
+                    # YAML scalars such as "expectation: 42" arrive as ints
+                    result.append(str(text))
+        return self._clause_pool.setdefault(tuple(result), result)
 
 
-class GherkinGenerator:
-    """Generate .feature files"""
+STEP_SECTIONS = ("Given", "When", "Then")
+
+
+def _collect_steps(criteria: Iterable[AcceptanceCriteria]) -> Tuple[Dict[str, None], ...]:
+    """Collect unique Given/When/Then step texts in a single pass over criteria
+    
+    Steps keep the order they first appear in acceptance.yaml.
+    """
+    given_steps: Dict[str, None] = {}
+    when_steps: Dict[str, None] = {}
+    then_steps: Dict[str, None] = {}
+    
+    for ac in criteria:
+        given_steps.update(dict.fromkeys(ac.given))
+        when_steps.update(dict.fromkeys(ac.when))
+        then_steps.update(dict.fromkeys(ac.then))
+        then_steps.update(dict.fromkeys(ac.and_clauses))
+    
+    return given_steps, when_steps, then_steps
+
+
+def _iter_step_sections(step_sets: Tuple[Dict[str, None], ...],
+                        render: Callable[[str, str], str]) -> Iterator[str]:
+    """Yield the Given/When/Then step definition sections line by line"""
+    for section, steps in zip(STEP_SECTIONS, step_sets):
+        yield f"// ===== {section} Steps ====="
+        yield ""
+        for step in steps:
+            yield render(section, step)
+            yield ""
+
+
+def generated_timestamp() -> str:
+    """Timestamp for generated file headers
+    
+    Honors SOURCE_DATE_EPOCH (reproducible builds) so identical specs
+    produce byte-identical output.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc).isoformat()
+    return datetime.now().isoformat()
+
+
+@functools.lru_cache(maxsize=None)
+def generator_digest() -> str:
+    """Short hash of this script, covering its templates and naming rules
+    
+    Mixed into spec_digest so editing the generator invalidates outputs
+    that would otherwise be skipped as up to date.
+    """
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+
+
+def spec_digest(data: bytes, lang: str) -> str:
+    """Content hash of acceptance.yaml bytes and the generator for a target language"""
+    return hashlib.sha256(data + lang.encode() + generator_digest().encode()).hexdigest()
+
+
+def spec_hash_header(comment_prefix: str, digest: str) -> str:
+    return f"{comment_prefix} spec-sha256: {digest} generator: {generator_digest()}"
+
+
+def is_up_to_date(output_path: Path, header: str) -> bool:
+    """Check whether an existing output already carries the given hash header"""
+    try:
+        with open(output_path, 'rb') as f:
+            head = f.read(256)
+    except OSError:
+        return False
+    return head.split(b"\n", 1)[0] == header.encode()
+
+
+class BaseGenerator:
+    """Base class for language generators"""
+    
+    comment_prefix = "//"
+    
+    def __init__(self, generated_at: Optional[str] = None):
+        self.generated_at = generated_at or generated_timestamp()
     
     def generate(self, parser: AcceptanceParser) -> str:
-        lines = [
+        return "\n".join(self.iter_lines(parser))
+    
+    def iter_lines(self, parser: AcceptanceParser) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class GherkinGenerator(BaseGenerator):
+    """Generate .feature files"""
+    
+    comment_prefix = "#"
+    
+    def iter_lines(self, parser: AcceptanceParser) -> Iterator[str]:
+        yield from (
             f"# Auto-generated from acceptance.yaml - DO NOT EDIT DIRECTLY",
-            f"# Last generated: {datetime.now().isoformat()}",
+            f"# Last generated: {self.generated_at}",
             f"# Feature: {parser.feature_name}",
             "",
             f"@feature-{parser.feature_name}",
             f"Feature: {self._humanize(parser.feature_name)}",
             "",
-        ]
+        )
         
         for ac in parser.criteria:
-            lines.extend(self._generate_scenario(ac))
-            lines.append("")
-        
-        return "\n".join(lines)
+            buf = io.StringIO()
+            self._write_scenario(ac, buf)
+            yield buf.getvalue()
+            yield ""
     
-    def _generate_scenario(self, ac: AcceptanceCriteria) -> List[str]:
-        lines = []
-        
+    def _write_scenario(self, ac: AcceptanceCriteria, buf: io.StringIO):
+        """Write one scenario block to buf (newline-separated, no trailing newline)"""
         # Tags
-        tags = [f"@{ac.id}"]
-        if ac.type:
-            tags.append(f"@{ac.type}")
-        if ac.test_tier:
-            tags.append(f"@{ac.test_tier}")
-        lines.append(f"  {' '.join(tags)}")
+        tags = " ".join(f"@{tag}" for tag in (ac.id, ac.type, ac.test_tier) if tag)
         
         # Trace comment
+        trace = ""
         if ac.trace.get("requirement"):
-            lines.append(f"  # Trace: {', '.join(ac.trace['requirement'])}")
+            trace += f"\n  # Trace: {', '.join(ac.trace['requirement'])}"
         if ac.trace.get("frame_concerns"):
-            lines.append(f"  # Frame Concerns: {', '.join(ac.trace['frame_concerns'])}")
+            trace += f"\n  # Frame Concerns: {', '.join(ac.trace['frame_concerns'])}"
         
         # Scenario
         has_examples = len(ac.examples) > 0
         keyword = "Scenario Outline" if has_examples else "Scenario"
-        lines.append(f"  {keyword}: {ac.name}")
-        
-        # Given
-        for i, clause in enumerate(ac.given):
-            prefix = "Given" if i == 0 else "And"
-            lines.append(f"    {prefix} {clause}")
-        
-        # When
-        for i, clause in enumerate(ac.when):
-            prefix = "When" if i == 0 else "And"
-            lines.append(f"    {prefix} {clause}")
+        buf.write(_render(_GHERKIN_SCENARIO_STATICS, (tags, trace, keyword, ac.name)))
         
-        # Then
-        for i, clause in enumerate(ac.then):
-            prefix = "Then" if i == 0 else "And"
-            lines.append(f"    {prefix} {clause}")
+        # Given / When / Then: first clause takes the keyword, the rest "And"
+        for keyword, clauses in zip(STEP_SECTIONS, (ac.given, ac.when, ac.then)):
+            prefixes = itertools.chain((keyword,), itertools.repeat("And"))
+            for prefix, clause in zip(prefixes, clauses):
+                buf.write("\n    " + prefix + " " + clause)
         
         # And
         for clause in ac.and_clauses:
-            lines.append(f"    And {clause}")
+            buf.write("\n    And " + clause)
         
         # Examples
         if has_examples:
-            lines.append("")
-            lines.append("    Examples:")
+            buf.write("\n\n    Examples:")
             headers = list(ac.examples[0].keys())
-            lines.append(f"      | {' | '.join(headers)} |")
+            buf.write(f"\n      | {' | '.join(headers)} |")
             for example in ac.examples:
                 values = [str(example.get(h, "")) for h in headers]
-                lines.append(f"      | {' | '.join(values)} |")
-        
-        return lines
+                buf.write(f"\n      | {' | '.join(values)} |")
     
     def _humanize(self, name: str) -> str:
         return name.replace("-", " ").replace("_", " ").title()
 
 
-class TypeScriptGenerator:
+class TypeScriptGenerator(BaseGenerator):
     """Generate Cucumber.js step definitions"""
     
-    def generate(self, parser: AcceptanceParser) -> str:
-        lines = [
+    def iter_lines(self, parser: AcceptanceParser) -> Iterator[str]:
+        yield from (
             "// Auto-generated from acceptance.yaml",
             f"// Feature: {parser.feature_name}",
-            f"// Generated: {datetime.now().isoformat()}",
+            f"// Generated: {self.generated_at}",
             "",
             "import { Given, When, Then, Before } from '@cucumber/cucumber';",
             "import { expect } from 'chai';",
@@ -252,78 +438,35 @@ class TypeScriptGenerator:
             "  this.error = null;",
             "});",
             "",
-        ]
-        
-        # Collect unique steps
-        given_steps = set()
-        when_steps = set()
-        then_steps = set()
-        
-        for ac in parser.criteria:
-            given_steps.update(ac.given)
-            when_steps.update(ac.when)
-            then_steps.update(ac.then + ac.and_clauses)
+        )
         
         # Generate step definitions
-        lines.append("// ===== Given Steps =====")
-        lines.append("")
-        for step in sorted(given_steps):
-            lines.extend(self._generate_step("Given", step))
-            lines.append("")
-        
-        lines.append("// ===== When Steps =====")
-        lines.append("")
-        for step in sorted(when_steps):
-            lines.extend(self._generate_step("When", step))
-            lines.append("")
-        
-        lines.append("// ===== Then Steps =====")
-        lines.append("")
-        for step in sorted(then_steps):
-            lines.extend(self._generate_step("Then", step))
-            lines.append("")
-        
-        return "\n".join(lines)
+        yield from _iter_step_sections(_collect_steps(parser.criteria), self._generate_step)
     
-    def _generate_step(self, step_type: str, step_text: str) -> List[str]:
-        # Extract placeholders like <boardId>
-        import re
-        placeholders = re.findall(r'<(\w+)>', step_text)
-        
-        # Convert to regex pattern
-        pattern = re.sub(r'<\w+>', '{string}', step_text)
+    def _generate_step(self, step_type: str, step_text: str) -> str:
+        # Extract placeholders and convert to Cucumber expression
+        placeholders, pattern = _parse_step(step_text)
         
         # Generate function signature
-        params = ", ".join([f"{p}: string" for p in placeholders])
-        
-        lines = [
-            f"{step_type}(",
-            f"  '{pattern}',",
-        ]
-        
-        if placeholders:
-            lines.append(f"  function(this: World, {params}) {{")
-        else:
-            lines.append(f"  function(this: World) {{")
-        
-        lines.append(f"    // TODO: Implement step - {step_text}")
-        lines.append(f"    throw new Error('Step not implemented');")
-        lines.append(f"  }}")
-        lines.append(f");")
+        params = "".join([f", {p}: string" for p in placeholders])
         
-        return lines
+        return _TS_STEP_TMPL.format(
+            step_type=step_type, pattern=pattern, params=params, step_text=step_text,
+        )
 
 
-class GinkgoGenerator:
+class GinkgoGenerator(BaseGenerator):
     """Generate Ginkgo test file"""
     
-    def generate(self, parser: AcceptanceParser) -> str:
+    def iter_lines(self, parser: AcceptanceParser) -> Iterator[str]:
         package_name = parser.feature_name.replace("-", "_")
+        pascal = self._pascal_case(parser.feature_name)
+        human = self._humanize(parser.feature_name)
         
-        lines = [
+        yield from (
             "// Auto-generated from acceptance.yaml",
             f"// Feature: {parser.feature_name}",
-            f"// Generated: {datetime.now().isoformat()}",
+            f"// Generated: {self.generated_at}",
             "",
             f"package {package_name}_test",
             "",
@@ -334,34 +477,33 @@ class GinkgoGenerator:
             '    . "github.com/onsi/gomega"',
             ")",
             "",
-            f'func Test{self._pascal_case(parser.feature_name)}(t *testing.T) {{',
+            f'func Test{pascal}(t *testing.T) {{',
             "    RegisterFailHandler(Fail)",
-            f'    RunSpecs(t, "{self._humanize(parser.feature_name)} Suite")',
+            f'    RunSpecs(t, "{human} Suite")',
             "}",
             "",
-            f'var _ = Describe("Feature: {self._humanize(parser.feature_name)}", func() {{',
+            f'var _ = Describe("Feature: {human}", func() {{',
             "",
-        ]
+        )
         
         for ac in parser.criteria:
-            lines.extend(self._generate_describe(ac))
-            lines.append("")
-        
-        lines.append("})")
+            yield from self._generate_describe(ac)
+            yield ""
         
-        return "\n".join(lines)
+        yield "})"
     
     def _generate_describe(self, ac: AcceptanceCriteria) -> List[str]:
-        lines = []
-        
         # Labels
         labels = [f'"{ac.id}"']
         if ac.type:
             labels.append(f'"{ac.type}"')
         
-        lines.append(f'    // Trace: {ac.trace.get("requirement", [])}')
-        lines.append(f'    // Frame Concerns: {ac.trace.get("frame_concerns", [])}')
-        lines.append(f'    Describe("Scenario: {ac.name}", Label({", ".join(labels)}), func() {{')
+        lines = [_render(_GINKGO_DESCRIBE_STATICS, (
+            str(ac.trace.get("requirement", [])),
+            str(ac.trace.get("frame_concerns", [])),
+            ac.name,
+            ", ".join(labels),
+        ))]
         
         # Given context
         if ac.given:
@@ -373,20 +515,10 @@ class GinkgoGenerator:
             lines.append(f'            }})')
             lines.append("")
         
-        # Then expectations
-        for t in ac.then:
-            lines.append(f'            It("{t}", func() {{')
-            lines.append(f'                // TODO: Implement assertion')
-            lines.append(f'                Expect(true).To(BeTrue())')
-            lines.append(f'            }})')
-            lines.append("")
-        
-        for a in ac.and_clauses:
-            lines.append(f'            It("{a}", func() {{')
-            lines.append(f'                // TODO: Implement assertion')
-            lines.append(f'                Expect(true).To(BeTrue())')
-            lines.append(f'            }})')
-            lines.append("")
+        # Then / And expectations
+        lines.extend(
+            _GINKGO_IT_TMPL.format(t=t) for t in itertools.chain(ac.then, ac.and_clauses)
+        )
         
         if ac.given:
             lines.append(f'        }})')
@@ -396,22 +528,23 @@ class GinkgoGenerator:
         return lines
     
     def _pascal_case(self, name: str) -> str:
-        return "".join(word.capitalize() for word in name.replace("-", "_").split("_"))
+        return name.translate(_SEP_TRANS).title().replace(" ", "")
     
     def _humanize(self, name: str) -> str:
         return name.replace("-", " ").replace("_", " ").title()
 
 
-class RustGenerator:
+class RustGenerator(BaseGenerator):
     """Generate cucumber-rs test file"""
     
-    def generate(self, parser: AcceptanceParser) -> str:
+    def iter_lines(self, parser: AcceptanceParser) -> Iterator[str]:
         mod_name = parser.feature_name.replace("-", "_")
+        world_type = f"{self._pascal_case(parser.feature_name)}World"
         
-        lines = [
+        yield from (
             "// Auto-generated from acceptance.yaml",
             f"// Feature: {parser.feature_name}",
-            f"// Generated: {datetime.now().isoformat()}",
+            f"// Generated: {self.generated_at}",
             "",
             "use cucumber::{given, when, then, World};",
             "use async_trait::async_trait;",
@@ -420,13 +553,13 @@ class RustGenerator:
             "",
             "#[derive(Debug, World)]",
             "#[world(init = Self::new)]",
-            f"pub struct {self._pascal_case(parser.feature_name)}World {{",
+            f"pub struct {world_type} {{",
             "    // TODO: Add test state fields",
             "    input: Option<TestInput>,",
             "    result: Option<Result<TestOutput, TestError>>,",
             "}",
             "",
-            f"impl {self._pascal_case(parser.feature_name)}World {{",
+            f"impl {world_type} {{",
             "    fn new() -> Self {",
             "        Self {",
             "            input: None,",
@@ -435,83 +568,146 @@ class RustGenerator:
             "    }",
             "}",
             "",
-        ]
-        
-        # Collect unique steps
-        given_steps = set()
-        when_steps = set()
-        then_steps = set()
-        
-        for ac in parser.criteria:
-            given_steps.update(ac.given)
-            when_steps.update(ac.when)
-            then_steps.update(ac.then + ac.and_clauses)
+        )
         
         # Generate step definitions
-        lines.append("// ===== Given Steps =====")
-        lines.append("")
-        for step in sorted(given_steps):
-            lines.extend(self._generate_step("given", step, parser.feature_name))
-            lines.append("")
-        
-        lines.append("// ===== When Steps =====")
-        lines.append("")
-        for step in sorted(when_steps):
-            lines.extend(self._generate_step("when", step, parser.feature_name))
-            lines.append("")
-        
-        lines.append("// ===== Then Steps =====")
-        lines.append("")
-        for step in sorted(then_steps):
-            lines.extend(self._generate_step("then", step, parser.feature_name))
-            lines.append("")
+        yield from _iter_step_sections(
+            _collect_steps(parser.criteria),
+            lambda section, step: self._generate_step(section.lower(), step, world_type),
+        )
         
         # Test runner
-        lines.extend([
+        yield from (
             "// ===== Test Runner =====",
             "",
             "#[tokio::main]",
             "async fn main() {",
-            f'    {self._pascal_case(parser.feature_name)}World::run("tests/features/{parser.feature_name}.feature").await;',
+            f'    {world_type}::run("tests/features/{parser.feature_name}.feature").await;',
             "}",
-        ])
-        
-        return "\n".join(lines)
+        )
     
-    def _generate_step(self, step_type: str, step_text: str, feature_name: str) -> List[str]:
-        import re
-        placeholders = re.findall(r'<(\w+)>', step_text)
-        
-        # Convert to cucumber-rs pattern
-        pattern = re.sub(r'<(\w+)>', r'{string}', step_text)
+    def _generate_step(self, step_type: str, step_text: str, world_type: str) -> str:
+        # Extract placeholders and convert to cucumber-rs pattern
+        placeholders, pattern = _parse_step(step_text)
         
         # Generate function name
-        func_name = re.sub(r'[^a-zA-Z0-9]', '_', step_text.lower())[:50]
-        
-        world_type = f"{self._pascal_case(feature_name)}World"
+        func_name = _NON_IDENT_RE.sub('_', step_text.lower())[:50]
         
         if placeholders:
-            params = ", ".join([f"{p}: String" for p in placeholders])
-            lines = [
-                f'#[{step_type}(expr = "{pattern}")]',
-                f"async fn {func_name}(world: &mut {world_type}, {params}) {{",
-                f"    // TODO: Implement step",
-                f"    todo!()",
-                f"}}",
-            ]
+            expr = f'expr = "{pattern}"'
         else:
-            lines = [
-                f'#[{step_type}("{step_text}")]',
-                f"async fn {func_name}(world: &mut {world_type}) {{",
-                f"    // TODO: Implement step",
-                f"    todo!()",
-                f"}}",
-            ]
+            expr = f'"{step_text}"'
+        params = "".join([f", {p}: String" for p in placeholders])
         
-        return lines
+        return _RUST_STEP_TMPL.format(
+            step_type=step_type, expr=expr, func_name=func_name,
+            world_type=world_type, params=params,
+        )
     
     def _pascal_case(self, name: str) -> str:
-        return "".join(word.capitalize() for word in name.replace("-", "_").split("_"))
+        return name.translate(_SEP_TRANS).title().replace(" ", "")
+
+
+# Language -> generator class (None: not yet implemented)
+GENERATORS = {
+    "gherkin": GherkinGenerator,
+    "typescript": TypeScriptGenerator,
+    "go": GinkgoGenerator,
+    "rust": RustGenerator,
+    "java": None,  # Placeholder
+}
+
+EXTENSIONS = {
+    "gherkin": ".feature",
+    "typescript": ".steps.ts",
+    "go": "_test.go",
+    "rust": ".rs",
+}
+
+
+def find_spec_dirs(specs_root: Path) -> List[Path]:
+    """Spec directories directly under specs_root that contain acceptance.yaml"""
+    spec_dirs = []
+    with os.scandir(specs_root) as it:
+        for entry in it:
+            if entry.is_dir() and AcceptanceParser(Path(entry.path)).find_acceptance_file():
+                spec_dirs.append(Path(entry.path))
+    return sorted(spec_dirs)
+
+
+def generate_spec(spec_dir: Path, langs: List[str], output: Optional[Path],
+                  force: bool, generated_at: str) -> int:
+    """Generate every requested language for one spec directory; returns an exit code
+    
+    Failures are reported and turned into exit code 1, so one bad spec does
+    not abort a --specs-root batch.
+    """
+    try:
+        return _generate_spec(spec_dir, langs, output, force, generated_at)
+    except Exception as e:
+        print(f"Error: {spec_dir}: {e}", file=sys.stderr)
+        return 1
+
+
+def _generate_spec(spec_dir: Path, langs: List[str], output: Optional[Path],
+                   force: bool, generated_at: str) -> int:
+    generators = {lang: GENERATORS[lang](generated_at) for lang in langs}
+    
+    # Read acceptance.yaml once; its hash decides whether to regenerate
+    acceptance_parser = AcceptanceParser(spec_dir)
+    acceptance_file = acceptance_parser.find_acceptance_file()
+    spec_bytes = acceptance_file.read_bytes() if acceptance_file else None
+    
+    pending = []
+    for lang in langs:
+        generator = generators[lang]
+        output_path = output / (spec_dir.name + EXTENSIONS[lang]) if output else None
+        
+        header = None
+        if spec_bytes is not None:
+            header = spec_hash_header(generator.comment_prefix, spec_digest(spec_bytes, lang))
+            if output_path and not force and is_up_to_date(output_path, header):
+                print(f"Up to date: {output_path}", file=sys.stderr)
+                continue
+        
+        pending.append((generator, output_path, header))
+    
+    if not pending:
+        return 0
+    
+    # Parse acceptance.yaml once for all requested languages
+    if not acceptance_parser.parse(spec_bytes):
+        print("ERROR: Failed to parse acceptance.yaml", file=sys.stderr)
+        return 1
+    
+    print(f"Parsed {len(acceptance_parser.criteria)} acceptance criteria", file=sys.stderr)
+    
+    for generator, output_path, header in pending:
+        # Stream lines straight to the destination instead of joining the whole
+        # output into one string first
+        lines = itertools.chain((header,), generator.iter_lines(acceptance_parser))
+        
+        # Output
+        if output_path:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Write to a sibling temp file and rename it into place, so readers
+            # (and the spec-sha256 check) never see a partial file
+            tmp_path = output_path.with_name(f"{output_path.name}.tmp{os.getpid()}")
+            try:
+                # Binary mode with a 128 KiB buffer skips the TextIOWrapper layer
+                with open(tmp_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                    f.writelines((line + "\n").encode('utf-8') for line in lines)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            
+            print(f"Generated: {output_path}", file=sys.stderr)
+        else:
+            sys.stdout.writelines(line + "\n" for line in lines)
+    
+    return 0
 
 
 def main():
@@ -521,73 +717,83 @@ def main():
     parser.add_argument(
         "spec_dir",
         type=Path,
+        nargs="?",
         help="Path to the spec directory containing acceptance.yaml"
     )
+    parser.add_argument(
+        "--specs-root",
+        type=Path,
+        help="Generate for every spec directory under this root in parallel (requires --output)"
+    )
     parser.add_argument(
         "--lang",
+        action="append",
         choices=["gherkin", "typescript", "go", "rust", "java"],
-        default="gherkin",
-        help="Target language/framework"
+        help="Target language/framework (default: gherkin); repeat for several, "
+             "which are generated from one parse and require --output"
     )
     parser.add_argument(
         "--output",
         type=Path,
         help="Output directory (default: stdout)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the output's spec-sha256 header is current"
+    )
     
     args = parser.parse_args()
     
-    if not args.spec_dir.exists():
-        print(f"ERROR: Spec directory not found: {args.spec_dir}", file=sys.stderr)
+    if (args.spec_dir is None) == (args.specs_root is None):
+        print("ERROR: Provide either a spec directory or --specs-root", file=sys.stderr)
         sys.exit(2)
     
-    # Parse acceptance.yaml
-    acceptance_parser = AcceptanceParser(args.spec_dir)
-    if not acceptance_parser.parse():
-        print("ERROR: Failed to parse acceptance.yaml", file=sys.stderr)
-        sys.exit(1)
+    # Each language is generated once even if repeated on the command line
+    langs = list(dict.fromkeys(args.lang or ["gherkin"]))
+    if len(langs) > 1 and not args.output:
+        print("ERROR: Multiple --lang values require --output", file=sys.stderr)
+        sys.exit(2)
     
-    print(f"Parsed {len(acceptance_parser.criteria)} acceptance criteria", file=sys.stderr)
+    for lang in langs:
+        if GENERATORS.get(lang) is None:
+            print(f"ERROR: Language '{lang}' not yet implemented", file=sys.stderr)
+            sys.exit(1)
+    
+    generated_at = generated_timestamp()
+    
+    if args.specs_root:
+        if not args.specs_root.is_dir():
+            print(f"ERROR: Specs root not found: {args.specs_root}", file=sys.stderr)
+            sys.exit(2)
+        if not args.output:
+            print("ERROR: --specs-root requires --output", file=sys.stderr)
+            sys.exit(2)
+        
+        spec_dirs = find_spec_dirs(args.specs_root)
+        if not spec_dirs:
+            print(f"ERROR: No spec directories with acceptance.yaml under {args.specs_root}", file=sys.stderr)
+            sys.exit(1)
+        
+        # Specs are independent: parse and emit them across all cores
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            exit_codes = list(pool.map(
+                generate_spec,
+                spec_dirs,
+                itertools.repeat(langs),
+                itertools.repeat(args.output),
+                itertools.repeat(args.force),
+                itertools.repeat(generated_at),
+            ))
+        
+        print(f"Processed {len(spec_dirs)} spec directories", file=sys.stderr)
+        sys.exit(max(exit_codes))
+    
+    if not args.spec_dir.exists():
+        print(f"ERROR: Spec directory not found: {args.spec_dir}", file=sys.stderr)
+        sys.exit(2)
     
-    # Generate based on language
-    generators = {
-        "gherkin": GherkinGenerator(),
-        "typescript": TypeScriptGenerator(),
-        "go": GinkgoGenerator(),
-        "rust": RustGenerator(),
-        "java": None,  # Placeholder
-    }
-    
-    generator = generators.get(args.lang)
-    if generator is None:
-        print(f"ERROR: Language '{args.lang}' not yet implemented", file=sys.stderr)
-        sys.exit(1)
-    
-    output = generator.generate(acceptance_parser)
-    
-    # Output
-    if args.output:
-        # Determine filename
-        extensions = {
-            "gherkin": ".feature",
-            "typescript": ".steps.ts",
-            "go": "_test.go",
-            "rust": ".rs",
-        }
-        ext = extensions.get(args.lang, ".txt")
-        filename = acceptance_parser.feature_name + ext
-        
-        output_path = args.output / filename
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(output)
-        
-        print(f"Generated: {output_path}", file=sys.stderr)
-    else:
-        print(output)
-    
-    sys.exit(0)
+    sys.exit(generate_spec(args.spec_dir, langs, args.output, args.force, generated_at))
 
 
 if __name__ == "__main__":
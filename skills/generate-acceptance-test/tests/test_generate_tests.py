@@ -0,0 +1,70 @@
+"""Tests for generate_tests.py
+
+Run: python -m unittest discover -s skills/generate-acceptance-test/tests
+"""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "generate_tests.py"
+sys.path.insert(0, str(SCRIPT.parent))
+
+import generate_tests  # noqa: E402
+
+GOOD_SPEC = """\
+acceptance_criteria:
+  - id: AC1
+    name: "Create a workflow"
+    given: ["a board"]
+    when: ["the user creates a workflow"]
+    then: ["the workflow exists"]
+"""
+
+# Top-level list: parses as YAML but is not a mapping
+BAD_SPEC = """\
+- acceptance_criteria:
+    - id: AC1
+"""
+
+
+class SpecsRootBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name) / "specs"
+        self.output = Path(self.tmp.name) / "out"
+        for name, content in (("bad-spec", BAD_SPEC), ("good-spec", GOOD_SPEC)):
+            spec_dir = self.root / name
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "acceptance.yaml").write_text(content)
+
+    def test_bad_spec_does_not_abort_batch(self):
+        proc = subprocess.run(
+            [sys.executable, str(SCRIPT), "--specs-root", str(self.root),
+             "--lang", "gherkin", "--output", str(self.output)],
+            capture_output=True, text=True,
+        )
+
+        self.assertEqual(proc.returncode, 1, proc.stderr)
+        self.assertNotIn("Traceback", proc.stderr)
+        self.assertIn("Processed 2 spec directories", proc.stderr)
+        self.assertTrue((self.output / "good-spec.feature").exists())
+        self.assertFalse((self.output / "bad-spec.feature").exists())
+
+    def test_unexpected_exception_is_reported_per_spec(self):
+        with mock.patch.object(generate_tests, "_generate_spec", side_effect=RuntimeError("boom")), \
+                mock.patch("sys.stderr") as stderr:
+            code = generate_tests.generate_spec(
+                self.root / "good-spec", ["gherkin"], self.output, False, "now")
+
+        self.assertEqual(code, 1)
+        written = "".join(call.args[0] for call in stderr.write.call_args_list)
+        self.assertIn(f"Error: {self.root / 'good-spec'}: boom", written)
+
+
+if __name__ == "__main__":
+    unittest.main()
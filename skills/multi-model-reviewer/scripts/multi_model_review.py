@@ -7,22 +7,87 @@ Multi-Model Reviewer Script
 
 Usage:
     python multi_model_review.py --spec-dir docs/specs/feature/ --program-dir src/ --test-dir tests/
+
+Exit codes:
+    0 - No errors (PASS or CONDITIONAL PASS)
+    1 - Errors found
+    2 - No model completed a review
 """
 
 import os
+import re
 import sys
 import json
+import time
+import signal
+import hashlib
+import functools
+import concurrent.futures
+import multiprocessing
+import threading
+from collections import Counter
 import yaml
 import argparse
 import subprocess
 import asyncio
+import importlib.util
 import httpx
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Callable, Any, Union
 from enum import Enum
 from datetime import datetime
 
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # optional: libuv event loop with cheaper scheduling
+except ImportError:
+    uvloop = None
+
+# Prefer libyaml's C loader/dumper; fall back to the pure-Python ones
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _parse_yaml_file(path: str) -> Any:
+    """Parse one YAML file; top-level so it can run in a worker process"""
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=SafeLoader)
+
+
+_process_pool_lock = threading.Lock()
+_process_pool_instance: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the YAML parsing process pool, creating it once on first use
+    
+    Forking a multithreaded process can deadlock, so workers come from a
+    forkserver (or spawn where that is unavailable).
+    """
+    global _process_pool_instance
+    with _process_pool_lock:
+        if _process_pool_instance is None:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _process_pool_instance = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context(method)
+            )
+        return _process_pool_instance
+
+
+def _shutdown_process_pool():
+    """Shut the YAML parsing pool down if it was ever started"""
+    global _process_pool_instance
+    with _process_pool_lock:
+        if _process_pool_instance is not None:
+            _process_pool_instance.shutdown()
+            _process_pool_instance = None
+
 
 class Severity(Enum):
     ERROR = "error"
@@ -62,131 +127,337 @@ class ReviewReport:
     warnings: int = 0
     errors: int = 0
     issues: List[ReviewIssue] = field(default_factory=list)
+    # Models that returned a review; empty means nothing was reviewed
+    reviewed_by: List[str] = field(default_factory=list)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Compact UTF-8 JSON encoding (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str (orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(frozen=True)
+class PromptPayload:
+    """Review prompt built and encoded once, then shared by every reviewer
+    
+    json is the prompt as a JSON string literal, ready to splice into HTTP
+    request bodies; full_text prepends the system prompt, and full_utf8 is
+    that text encoded for CLI reviewers' stdin. digest is the SHA-256 of
+    full_utf8, used in response cache keys.
+    """
+    text: str
+    json: bytes
+    full_text: str
+    full_utf8: bytes
+    digest: str
+    
+    @classmethod
+    def build(cls, text: str) -> "PromptPayload":
+        full_text = f"{REVIEW_SYSTEM_PROMPT}\n\n{text}"
+        full_utf8 = full_text.encode()
+        return cls(
+            text=text,
+            json=_json_bytes(text),
+            full_text=full_text,
+            full_utf8=full_utf8,
+            digest=hashlib.sha256(full_utf8).hexdigest(),
+        )
+
+
+async def _run_cli(args: List[str], input_data: bytes, timeout: float) -> bytes:
+    """Run a CLI with input_data on stdin and return its stdout
+    
+    Passing the prompt on stdin instead of argv avoids ARG_MAX limits and
+    copying the prompt into the argument vector. The CLI runs in its own
+    session, and the whole process group is killed if it times out or the
+    caller is cancelled, so helpers it spawned cannot hold the pipes open.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(input_data), timeout=timeout)
+    except BaseException:
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, ProcessLookupError):
+                # No process groups (Windows) or the group already exited
+                process.kill()
+            await process.wait()
+        raise
+    return stdout
+
+
+# On-disk cache of successful model responses, keyed by model + prompt
+REVIEW_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "multi_model_review"
+REVIEW_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_cli(cli_command: str) -> bool:
+    """Check once per process whether a CLI is installed and runnable"""
+    try:
+        subprocess.run([cli_command, "--version"], 
+                     capture_output=True, check=True, timeout=5)
+        return True
+    except:
+        return False
 
 
 class ModelReviewer:
     """Base class for AI model reviewers"""
     
-    def __init__(self, name: str, enabled: bool = True):
+    def __init__(self, name: str, enabled: bool = True,
+                 client: Optional[httpx.AsyncClient] = None):
         self.name = name
         self.enabled = enabled
+        self.client = client
+        self.cache_dir: Optional[Path] = REVIEW_CACHE_DIR
     
-    async def review(self, prompt: str, context: Dict) -> Dict:
-        """Execute review and return findings"""
+    async def review(self, prompt: Union[str, PromptPayload], context: Dict) -> Dict:
+        """Execute review and return findings, reusing a cached response if fresh"""
+        if isinstance(prompt, str):
+            prompt = PromptPayload.build(prompt)
+        
+        cache_path = self._cache_path(prompt)
+        if cache_path is not None:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
+        
+        result = await self._review(prompt, context)
+        
+        if cache_path is not None and "error" not in result:
+            self._write_cache(cache_path, result)
+        return result
+    
+    async def _review(self, prompt: PromptPayload, context: Dict) -> Dict:
+        """Query the model; implemented by each reviewer"""
         raise NotImplementedError
+    
+    def _cache_path(self, prompt: PromptPayload) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        # The prompt is hashed once in PromptPayload.build, not per reviewer
+        key = hashlib.sha256(
+            f"{self.name}\0{getattr(self, 'model', '')}\0{prompt.digest}".encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    @staticmethod
+    def _read_cache(cache_path: Path) -> Optional[Dict]:
+        try:
+            if time.time() - cache_path.stat().st_mtime > REVIEW_CACHE_TTL:
+                return None
+            return _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write_cache(cache_path: Path, result: Dict):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.tmp{os.getpid()}")
+            tmp_path.write_bytes(_json_bytes(result))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Caching is best-effort
+    
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """POST via the shared client, or a one-off client when none was injected"""
+        if self.client is not None:
+            return await self.client.post(url, **kwargs)
+        async with httpx.AsyncClient() as client:
+            return await client.post(url, **kwargs)
 
 
 class ChatGPTReviewer(ModelReviewer):
     """ChatGPT 5.2 via OpenAI API"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o"):
-        super().__init__("chatgpt")
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o",
+                 client: Optional[httpx.AsyncClient] = None):
+        super().__init__("chatgpt", client=client)
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.model = model
         self.enabled = bool(self.api_key)
     
-    async def review(self, prompt: str, context: Dict) -> Dict:
+    async def _review(self, prompt: PromptPayload, context: Dict) -> Dict:
         if not self.enabled:
             return {"model": self.name, "error": "API key not configured"}
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {"role": "system", "content": REVIEW_SYSTEM_PROMPT},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.1,
-                        "response_format": {"type": "json_object"}
-                    },
-                    timeout=60.0
-                )
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                return {"model": self.name, "findings": json.loads(content)}
+            # Splice the pre-encoded prompts into the body instead of
+            # re-serializing the whole context per request
+            body = b"".join([
+                b'{"model":', _json_bytes(self.model),
+                b',"messages":[{"role":"system","content":', _SYSTEM_PROMPT_JSON,
+                b'},{"role":"user","content":', prompt.json,
+                b'}],"temperature":0.1,"response_format":{"type":"json_object"}}',
+            ])
+            response = await self._post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                content=body,
+                timeout=60.0
+            )
+            result = _json_loads(response.content)
+            content = result["choices"][0]["message"]["content"]
+            return {"model": self.name, "findings": _json_loads(content)}
         except Exception as e:
             return {"model": self.name, "error": str(e)}
 
 
-class GeminiReviewer(ModelReviewer):
-    """Gemini via local CLI"""
+class PersistentCLIWorker:
+    """Long-lived CLI process serving requests over stdin/stdout
     
-    def __init__(self, cli_command: str = "gemini"):
-        super().__init__("gemini")
-        self.cli_command = cli_command
-        self.enabled = self._check_cli_available()
+    Requests and replies are framed as a 4-byte big-endian length followed
+    by the payload; an empty request is a handshake answered with an empty
+    reply. Requests are serialized with a lock; the process is started on
+    first use and restarted after a failed exchange.
+    """
     
-    def _check_cli_available(self) -> bool:
+    # Seconds a freshly started worker has to answer the handshake
+    STARTUP_TIMEOUT = 10
+    
+    def __init__(self, args: List[str]):
+        self.args = args
+        self.process: Optional[asyncio.subprocess.Process] = None
+        # Set once the CLI turns out not to speak the protocol
+        self.failed = False
+        self._lock = asyncio.Lock()
+    
+    async def request(self, payload: bytes, timeout: float) -> bytes:
+        async with self._lock:
+            if self.process is None:
+                await self._start()
+            try:
+                return await asyncio.wait_for(self._exchange(payload), timeout=timeout)
+            except BaseException:
+                # The stream position is unknown after a failure; start over
+                await self._kill()
+                raise
+    
+    async def _start(self):
+        self.process = await asyncio.create_subprocess_exec(
+            *self.args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
         try:
-            subprocess.run([self.cli_command, "--version"], 
-                         capture_output=True, check=True, timeout=5)
-            return True
-        except:
-            return False
+            await asyncio.wait_for(self._exchange(b""), timeout=self.STARTUP_TIMEOUT)
+        except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError) as e:
+            await self._kill()
+            raise ConnectionError(f"{self.args[0]} did not answer the worker handshake") from e
     
-    async def review(self, prompt: str, context: Dict) -> Dict:
-        if not self.enabled:
-            return {"model": self.name, "error": "CLI not available"}
-        
+    async def _exchange(self, payload: bytes) -> bytes:
+        self.process.stdin.write(len(payload).to_bytes(4, "big") + payload)
+        await self.process.stdin.drain()
+        header = await self.process.stdout.readexactly(4)
+        return await self.process.stdout.readexactly(int.from_bytes(header, "big"))
+    
+    async def _kill(self):
+        process, self.process = self.process, None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+    
+    async def aclose(self):
+        """Close stdin so the worker can exit, killing it if it lingers"""
+        process = self.process
+        if process is None or process.returncode is not None:
+            return
+        process.stdin.close()
         try:
-            full_prompt = f"{REVIEW_SYSTEM_PROMPT}\n\n{prompt}"
-            process = await asyncio.create_subprocess_exec(
-                self.cli_command, "-p", full_prompt, "--json",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=120)
-            return {"model": self.name, "findings": json.loads(stdout.decode())}
-        except Exception as e:
-            return {"model": self.name, "error": str(e)}
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            await self._kill()
+        self.process = None
 
 
-class CodexReviewer(ModelReviewer):
-    """Codex via local CLI"""
+class CLIReviewer(ModelReviewer):
+    """Reviewer backed by a local CLI that reads the prompt from stdin"""
     
-    def __init__(self, cli_command: str = "codex"):
-        super().__init__("codex")
+    # Arguments after the command; the prompt itself goes to stdin
+    cli_args: tuple = ()
+    timeout = 120
+    
+    def __init__(self, name: str, cli_command: str):
+        super().__init__(name)
         self.cli_command = cli_command
         self.enabled = self._check_cli_available()
+        # Opt-in persistent worker (models.<name>.server_args in the config)
+        self.worker: Optional[PersistentCLIWorker] = None
     
     def _check_cli_available(self) -> bool:
-        try:
-            subprocess.run([self.cli_command, "--version"], 
-                         capture_output=True, check=True, timeout=5)
-            return True
-        except:
-            return False
+        return _probe_cli(self.cli_command)
     
-    async def review(self, prompt: str, context: Dict) -> Dict:
+    async def _call_cli(self, input_data: bytes, timeout: float) -> bytes:
+        """Send input to the persistent worker if configured, else spawn the CLI"""
+        if self.worker is not None and not self.worker.failed:
+            try:
+                return await self.worker.request(input_data, timeout)
+            except asyncio.TimeoutError:
+                raise  # A slow answer is not a protocol failure
+            except (OSError, asyncio.IncompleteReadError):
+                # No usable server mode: fall back to one process per call
+                self.worker.failed = True
+        return await _run_cli([self.cli_command, *self.cli_args], input_data, timeout)
+    
+    async def _review(self, prompt: PromptPayload, context: Dict) -> Dict:
         if not self.enabled:
             return {"model": self.name, "error": "CLI not available"}
         
         try:
-            full_prompt = f"{REVIEW_SYSTEM_PROMPT}\n\n{prompt}"
-            process = await asyncio.create_subprocess_exec(
-                self.cli_command, "--prompt", full_prompt, "--format", "json",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=120)
-            return {"model": self.name, "findings": json.loads(stdout.decode())}
+            stdout = await self._call_cli(prompt.full_utf8, self.timeout)
+            return {"model": self.name, "findings": _json_loads(stdout)}
         except Exception as e:
             return {"model": self.name, "error": str(e)}
 
 
+class GeminiReviewer(CLIReviewer):
+    """Gemini via local CLI"""
+    
+    cli_args = ("--json",)
+    
+    def __init__(self, cli_command: str = "gemini"):
+        super().__init__("gemini", cli_command)
+
+
+class CodexReviewer(CLIReviewer):
+    """Codex via local CLI"""
+    
+    cli_args = ("--format", "json")
+    
+    def __init__(self, cli_command: str = "codex"):
+        super().__init__("codex", cli_command)
+
+
 class QWENReviewer(ModelReviewer):
     """QWEN 32B via local Ollama"""
     
     def __init__(self, endpoint: str = "http://localhost:11434/api/generate", 
-                 model: str = "qwen2.5:32b"):
-        super().__init__("qwen")
+                 model: str = "qwen2.5:32b", client: Optional[httpx.AsyncClient] = None):
+        super().__init__("qwen", client=client)
         self.endpoint = endpoint
         self.model = model
         self.enabled = self._check_ollama_available()
@@ -199,90 +470,130 @@ class QWENReviewer(ModelReviewer):
         except:
             return False
     
-    async def review(self, prompt: str, context: Dict) -> Dict:
+    async def _review(self, prompt: PromptPayload, context: Dict) -> Dict:
         if not self.enabled:
             return {"model": self.name, "error": "Ollama not available"}
         
         try:
-            full_prompt = f"{REVIEW_SYSTEM_PROMPT}\n\n{prompt}\n\nRespond in JSON format."
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.endpoint,
-                    json={
-                        "model": self.model,
-                        "prompt": full_prompt,
-                        "stream": False,
-                        "format": "json"
-                    },
-                    timeout=180.0
-                )
-                result = response.json()
-                return {"model": self.name, "findings": json.loads(result["response"])}
+            full_prompt = f"{prompt.full_text}\n\nRespond in JSON format."
+            body = b"".join([
+                b'{"model":', _json_bytes(self.model),
+                b',"prompt":', _json_bytes(full_prompt),
+                b',"stream":false,"format":"json"}',
+            ])
+            response = await self._post(
+                self.endpoint,
+                headers={"Content-Type": "application/json"},
+                content=body,
+                timeout=180.0
+            )
+            result = _json_loads(response.content)
+            return {"model": self.name, "findings": _json_loads(result["response"])}
         except Exception as e:
             return {"model": self.name, "error": str(e)}
 
 
-class ClaudeReviewer(ModelReviewer):
+class ClaudeReviewer(CLIReviewer):
     """Claude via local CLI (as final arbiter)"""
     
+    # `claude -p` without a prompt argument reads the prompt from stdin
+    cli_args = ("-p", "--output-format", "json")
+    
+    # Model-reported type strings; unknown or missing types use the default
+    _ISSUE_TYPE_LOOKUP = {t.value: t for t in IssueType}
+    _DEFAULT_ISSUE_TYPE = IssueType.SPEC_PROGRAM_MISMATCH
+    
     def __init__(self, cli_command: str = "claude"):
-        super().__init__("claude")
-        self.cli_command = cli_command
-        self.enabled = self._check_cli_available()
+        super().__init__("claude", cli_command)
         self.is_arbiter = True
     
-    def _check_cli_available(self) -> bool:
-        try:
-            subprocess.run([self.cli_command, "--version"], 
-                         capture_output=True, check=True, timeout=5)
-            return True
-        except:
-            return False
+    async def filter_false_positives(self, all_findings: List[Dict], 
+                                      context: Dict, timeout: float = 180,
+                                      hedge_after: Optional[float] = 30) -> List[ReviewIssue]:
+        """Claude as final arbiter to filter false positives
+        
+        Issues every answering model reported are settled by consensus
+        directly; only the contested ones are sent to the arbiter.
+        """
+        agreed, contested = self._split_unanimous(all_findings)
+        issues = self._consensus_filter(agreed) if agreed else []
+        
+        if any(f["findings"]["issues"] for f in contested):
+            issues += await self._arbitrate(contested, context, timeout, hedge_after)
+        else:
+            print("  ✅ all models agree, skipping arbitration")
+        
+        for n, issue in enumerate(issues, 1):
+            issue.id = f"ISSUE-{n:03d}"
+        return issues
     
-    async def review(self, prompt: str, context: Dict) -> Dict:
-        if not self.enabled:
-            return {"model": self.name, "error": "CLI not available"}
+    @staticmethod
+    def _issue_key(issue: Dict) -> str:
+        return f"{issue.get('type')}:{issue.get('location')}"
+    
+    def _split_unanimous(self, all_findings: List[Dict]):
+        """Split answered findings into (unanimous, contested) finding lists
         
-        try:
-            full_prompt = f"{REVIEW_SYSTEM_PROMPT}\n\n{prompt}"
-            process = await asyncio.create_subprocess_exec(
-                self.cli_command, "-p", full_prompt, "--output-format", "json",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+        An issue is unanimous when at least two models answered and every
+        one of them reported it. Both lists keep the per-model shape.
+        """
+        answered = [f for f in all_findings if "error" not in f]
+        per_model = [f.get("findings", {}).get("issues", []) for f in answered]
+        
+        unanimous: Set[str] = set()
+        if len(answered) >= 2:
+            unanimous = set.intersection(
+                *({self._issue_key(i) for i in issues} for issues in per_model)
             )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=120)
-            return {"model": self.name, "findings": json.loads(stdout.decode())}
-        except Exception as e:
-            return {"model": self.name, "error": str(e)}
+        
+        agreed, contested = [], []
+        for finding, issues in zip(answered, per_model):
+            model = finding["model"]
+            agreed.append({"model": model, "findings": {
+                "issues": [i for i in issues if self._issue_key(i) in unanimous]}})
+            contested.append({"model": model, "findings": {
+                "issues": [i for i in issues if self._issue_key(i) not in unanimous]}})
+        return (agreed if unanimous else []), contested
     
-    async def filter_false_positives(self, all_findings: List[Dict], 
-                                      context: Dict) -> List[ReviewIssue]:
-        """Claude as final arbiter to filter false positives"""
-        arbiter_prompt = self._build_arbiter_prompt(all_findings, context)
+    async def _arbitrate(self, findings: List[Dict], context: Dict, timeout: float,
+                         hedge_after: Optional[float] = None) -> List[ReviewIssue]:
+        """Ask the arbiter to judge findings, hedged by model consensus
+        
+        The consensus result is ready up front. If the arbiter has not
+        answered within hedge_after seconds it is cancelled and consensus is
+        used; errors and timeouts fall back to consensus as well.
+        """
+        fallback = self._consensus_filter(findings)
+        arbiter = asyncio.create_task(
+            self._call_cli(self._build_arbiter_prompt(findings, context), timeout=timeout)
+        )
+        
+        done, _ = await asyncio.wait({arbiter}, timeout=hedge_after)
+        if not done:
+            arbiter.cancel()
+            try:
+                await arbiter
+            except (asyncio.CancelledError, Exception):
+                pass
+            print(f"  ⚠️  arbiter still running after {hedge_after:g}s, using model consensus")
+            return fallback
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                self.cli_command, "-p", arbiter_prompt, "--output-format", "json",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=180)
-            result = json.loads(stdout.decode())
-            return self._parse_arbiter_result(result)
+            return self._parse_arbiter_result(_json_loads(arbiter.result()))
         except Exception as e:
-            # Fallback: use consensus-based filtering
-            return self._consensus_filter(all_findings)
+            reason = "timeout" if isinstance(e, asyncio.TimeoutError) else type(e).__name__
+            print(f"  ⚠️  arbiter unavailable ({reason}), using model consensus")
+            return fallback
     
-    def _build_arbiter_prompt(self, findings: List[Dict], context: Dict) -> str:
-        return f"""You are the final arbiter for a multi-model code review.
+    # Static parts of the arbiter prompt, encoded once
+    _ARBITER_PREFIX = b"""You are the final arbiter for a multi-model code review.
 
 Multiple AI models have reviewed the following context:
-- Specification: {context.get('spec_summary', 'N/A')}
-- Program: {context.get('program_summary', 'N/A')}
-- Tests: {context.get('test_summary', 'N/A')}
-
+"""
+    _ARBITER_FINDINGS_HEADER = b"""
 Here are the findings from each model:
-{json.dumps(findings, indent=2)}
+"""
+    _ARBITER_SUFFIX = """
 
 Your task:
 1. Cross-compare findings from all models
@@ -293,12 +604,27 @@ Your task:
 6. Provide actionable fix suggestions
 
 Respond in JSON format:
-{{
+{
     "confirmed_issues": [...],
     "warnings": [...],
     "discarded_as_false_positive": [...]
-}}
-"""
+}
+""".encode()
+    
+    def _build_arbiter_prompt(self, findings: List[Dict], context: Dict) -> bytes:
+        """Assemble the arbiter prompt as UTF-8 bytes for the CLI's stdin"""
+        summaries = (
+            f"- Specification: {context.get('spec_summary', 'N/A')}\n"
+            f"- Program: {context.get('program_summary', 'N/A')}\n"
+            f"- Tests: {context.get('test_summary', 'N/A')}\n"
+        )
+        return b"".join([
+            self._ARBITER_PREFIX,
+            summaries.encode(),
+            self._ARBITER_FINDINGS_HEADER,
+            _json_bytes(findings),
+            self._ARBITER_SUFFIX,
+        ])
     
     def _parse_arbiter_result(self, result: Dict) -> List[ReviewIssue]:
         issues = []
@@ -308,7 +634,7 @@ Respond in JSON format:
             issues.append(ReviewIssue(
                 id=f"ISSUE-{issue_id:03d}",
                 severity=Severity.ERROR,
-                issue_type=IssueType(item.get("type", "spec_program_mismatch")),
+                issue_type=self._ISSUE_TYPE_LOOKUP.get(item.get("type"), self._DEFAULT_ISSUE_TYPE),
                 description=item.get("description", ""),
                 detected_by=item.get("detected_by", []),
                 spec_location=item.get("spec_location"),
@@ -322,7 +648,7 @@ Respond in JSON format:
             issues.append(ReviewIssue(
                 id=f"ISSUE-{issue_id:03d}",
                 severity=Severity.WARNING,
-                issue_type=IssueType(item.get("type", "spec_program_mismatch")),
+                issue_type=self._ISSUE_TYPE_LOOKUP.get(item.get("type"), self._DEFAULT_ISSUE_TYPE),
                 description=item.get("description", ""),
                 detected_by=item.get("detected_by", []),
                 confidence="medium"
@@ -333,8 +659,10 @@ Respond in JSON format:
     
     def _consensus_filter(self, all_findings: List[Dict]) -> List[ReviewIssue]:
         """Fallback: filter based on model consensus"""
-        issue_votes: Dict[str, List[str]] = {}
-        issue_details: Dict[str, Dict] = {}
+        # Parallel lists, one entry per reported issue
+        keys: List[str] = []
+        models: List[str] = []
+        first_seen: Dict[str, Dict] = {}
         
         for finding in all_findings:
             if "error" in finding:
@@ -342,31 +670,40 @@ Respond in JSON format:
             
             model = finding["model"]
             for issue in finding.get("findings", {}).get("issues", []):
-                key = f"{issue.get('type')}:{issue.get('location')}"
-                if key not in issue_votes:
-                    issue_votes[key] = []
-                    issue_details[key] = issue
-                issue_votes[key].append(model)
+                key = self._issue_key(issue)
+                keys.append(key)
+                models.append(model)
+                first_seen.setdefault(key, issue)
+        
+        vote_count = Counter(keys)
+        
+        # Voter lists only for keys that survive the single-model cut
+        issue_votes: Dict[str, List[str]] = {
+            key: [] for key, count in vote_count.items() if count >= 2
+        }
+        for key, model in zip(keys, models):
+            voters = issue_votes.get(key)
+            if voters is not None:
+                voters.append(model)
         
         issues = []
         issue_id = 1
         
         for key, voters in issue_votes.items():
-            details = issue_details[key]
+            details = first_seen[key]
             
+            # Single-model findings were already dropped from issue_votes
             if len(voters) >= 3:
                 severity = Severity.ERROR
                 confidence = "high"
-            elif len(voters) == 2:
+            else:
                 severity = Severity.WARNING
                 confidence = "medium"
-            else:
-                continue  # Discard single-model findings
             
             issues.append(ReviewIssue(
                 id=f"ISSUE-{issue_id:03d}",
                 severity=severity,
-                issue_type=IssueType(details.get("type", "spec_program_mismatch")),
+                issue_type=self._ISSUE_TYPE_LOOKUP.get(details.get("type"), self._DEFAULT_ISSUE_TYPE),
                 description=details.get("description", ""),
                 detected_by=voters,
                 confidence=confidence
@@ -408,53 +745,117 @@ Report findings as JSON:
     ]
 }
 """
+_SYSTEM_PROMPT_JSON = _json_bytes(REVIEW_SYSTEM_PROMPT)
+
+
+def _walk_files(root: Path, match: Callable[[str], bool]) -> List[Path]:
+    """Walk root once with os.scandir, returning sorted files whose name matches"""
+    found = []
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif match(entry.name) and entry.is_file():
+                    found.append(Path(entry.path))
+    found.sort()
+    return found
 
 
 class SpecProgramTestCollector:
     """Collect and summarize Spec, Program, and Test artifacts"""
     
-    def __init__(self, spec_dir: Path, program_dir: Path, test_dir: Path):
+    PROGRAM_EXTENSIONS = (".java", ".ts", ".go", ".rs")
+    TEST_PATTERN = re.compile(r"(?:Test\.java|\.test\.ts|_test\.go|_test\.rs|\.spec\.ts)$")
+    # Max files read concurrently
+    IO_CONCURRENCY = 32
+    # Parse specs in worker processes once there are at least this many and
+    # more than one CPU. Pool start-up (~0.15-0.8 s with forkserver) and IPC
+    # (~0.1 ms/file) only pay off against ~0.7 ms/file CSafeLoader parsing
+    # past roughly 400-2000 files, depending on core count.
+    PROCESS_PARSE_THRESHOLD = 2000
+    
+    def __init__(self, spec_dir: Path, program_dir: Path, test_dir: Path,
+                 io_concurrency: Optional[int] = None):
         self.spec_dir = spec_dir
         self.program_dir = program_dir
         self.test_dir = test_dir
+        self._io_limit = asyncio.Semaphore(io_concurrency or self.IO_CONCURRENCY)
+        # Memoized _collect_* results
+        self._collected: Dict[str, Dict] = {}
     
-    def collect(self) -> Dict:
+    async def collect(self) -> Dict:
+        specs, programs, tests = await asyncio.gather(
+            self._collect_specs(),
+            self._collect_programs(),
+            self._collect_tests(),
+        )
         return {
-            "spec": self._collect_specs(),
-            "program": self._collect_programs(),
-            "test": self._collect_tests(),
-            "spec_summary": self._summarize_specs(),
-            "program_summary": self._summarize_programs(),
-            "test_summary": self._summarize_tests()
+            "spec": specs,
+            "program": programs,
+            "test": tests,
+            "spec_summary": self._summarize_specs(specs),
+            "program_summary": self._summarize_programs(programs),
+            "test_summary": self._summarize_tests(tests)
         }
     
-    def _collect_specs(self) -> Dict:
-        specs = {}
-        for yaml_file in self.spec_dir.rglob("*.yaml"):
-            with open(yaml_file) as f:
-                specs[str(yaml_file.relative_to(self.spec_dir))] = yaml.safe_load(f)
-        return specs
-    
-    def _collect_programs(self) -> Dict:
-        programs = {}
-        extensions = ["*.java", "*.ts", "*.go", "*.rs"]
-        for ext in extensions:
-            for code_file in self.program_dir.rglob(ext):
-                with open(code_file) as f:
-                    programs[str(code_file.relative_to(self.program_dir))] = f.read()
-        return programs
-    
-    def _collect_tests(self) -> Dict:
-        tests = {}
-        patterns = ["*Test.java", "*.test.ts", "*_test.go", "*_test.rs", "*.spec.ts"]
-        for pattern in patterns:
-            for test_file in self.test_dir.rglob(pattern):
-                with open(test_file) as f:
-                    tests[str(test_file.relative_to(self.test_dir))] = f.read()
-        return tests
-    
-    def _summarize_specs(self) -> str:
-        specs = self._collect_specs()
+    async def _read_all(self, base_dir: Path, paths: List[Path],
+                        loader: Callable[[Path], Any]) -> Dict:
+        """Load files in worker threads, bounded by IO_CONCURRENCY, keyed by relative path"""
+        async def read(path: Path):
+            async with self._io_limit:
+                return await asyncio.to_thread(loader, path)
+        
+        contents = await asyncio.gather(*(read(p) for p in paths))
+        return {str(p.relative_to(base_dir)): c for p, c in zip(paths, contents)}
+    
+    @staticmethod
+    def _load_yaml(path: Path):
+        return _parse_yaml_file(str(path))
+    
+    @staticmethod
+    def _read_text(path: Path) -> str:
+        with open(path) as f:
+            return f.read()
+    
+    async def _collect_specs(self) -> Dict:
+        if "spec" not in self._collected:
+            paths = await asyncio.to_thread(
+                _walk_files, self.spec_dir, lambda name: name.endswith(".yaml"))
+            if len(paths) >= self.PROCESS_PARSE_THRESHOLD and (os.cpu_count() or 1) > 1:
+                # Large batches are CPU-bound; parse them off the GIL
+                loop = asyncio.get_running_loop()
+                pool = _process_pool()
+                contents = await asyncio.gather(*(
+                    loop.run_in_executor(pool, _parse_yaml_file, str(p)) for p in paths
+                ))
+                self._collected["spec"] = {
+                    str(p.relative_to(self.spec_dir)): c for p, c in zip(paths, contents)
+                }
+            else:
+                self._collected["spec"] = await self._read_all(self.spec_dir, paths, self._load_yaml)
+        return self._collected["spec"]
+    
+    async def _collect_programs(self) -> Dict:
+        if "program" not in self._collected:
+            paths = await asyncio.to_thread(
+                _walk_files, self.program_dir, lambda name: name.endswith(self.PROGRAM_EXTENSIONS))
+            self._collected["program"] = await self._read_all(self.program_dir, paths, self._read_text)
+        return self._collected["program"]
+    
+    async def _collect_tests(self) -> Dict:
+        if "test" not in self._collected:
+            paths = await asyncio.to_thread(
+                _walk_files, self.test_dir, lambda name: self.TEST_PATTERN.search(name) is not None)
+            self._collected["test"] = await self._read_all(self.test_dir, paths, self._read_text)
+        return self._collected["test"]
+    
+    def _summarize_specs(self, specs: Dict) -> str:
         summary = []
         
         # Frame
@@ -474,8 +875,7 @@ class SpecProgramTestCollector:
         
         return "; ".join(summary) if summary else "No specs found"
     
-    def _summarize_programs(self) -> str:
-        programs = self._collect_programs()
+    def _summarize_programs(self, programs: Dict) -> str:
         summary = [f"Files: {len(programs)}"]
         
         # Count classes/functions
@@ -485,23 +885,62 @@ class SpecProgramTestCollector:
         
         return "; ".join(summary)
     
-    def _summarize_tests(self) -> str:
-        tests = self._collect_tests()
+    def _summarize_tests(self, tests: Dict) -> str:
         return f"Test files: {len(tests)}"
 
 
 class MultiModelReviewOrchestrator:
     """Orchestrate multi-model review process"""
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, use_cache: bool = True,
+                 io_concurrency: Optional[int] = None):
         self.config = self._load_config(config_path)
+        self.use_cache = use_cache
+        self.io_concurrency = io_concurrency
+        # One pooled client shared by all HTTP reviewers so connections
+        # (and TLS sessions) are reused across reviews
+        self.http_client = self._create_http_client()
         self.reviewers = self._init_reviewers()
         self.arbiter = ClaudeReviewer()
+        self._attach_workers([*self.reviewers, self.arbiter])
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        # HTTP/2 needs the optional h2 package
+        http2 = importlib.util.find_spec("h2") is not None
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            http2=http2,
+        )
+    
+    def _attach_workers(self, reviewers: List[ModelReviewer]):
+        """Give CLI reviewers with models.<name>.server_args a persistent worker
+        
+        The arbiter shares the claude reviewer's worker.
+        """
+        models = self.config.get("models", {})
+        workers: Dict[str, PersistentCLIWorker] = {}
+        for reviewer in reviewers:
+            if not isinstance(reviewer, CLIReviewer):
+                continue
+            server_args = models.get(reviewer.name, {}).get("server_args")
+            if not server_args:
+                continue
+            if reviewer.name not in workers:
+                workers[reviewer.name] = PersistentCLIWorker(
+                    [reviewer.cli_command, *server_args]
+                )
+            reviewer.worker = workers[reviewer.name]
+        self.workers = list(workers.values())
+    
+    async def aclose(self):
+        """Close the shared HTTP client and any persistent CLI workers"""
+        await asyncio.gather(*(worker.aclose() for worker in self.workers))
+        await self.http_client.aclose()
     
     def _load_config(self, config_path: Optional[Path]) -> Dict:
         if config_path and config_path.exists():
             with open(config_path) as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         
         # Default config
         return {
@@ -515,6 +954,11 @@ class MultiModelReviewOrchestrator:
             "consensus": {
                 "error_threshold": 3,
                 "warning_threshold": 2
+            },
+            "review": {
+                "straggler_slack": None,
+                "arbiter_timeout": 180,
+                "arbiter_hedge_after": 30
             }
         }
     
@@ -523,16 +967,20 @@ class MultiModelReviewOrchestrator:
         models = self.config.get("models", {})
         
         if models.get("chatgpt", {}).get("enabled", True):
-            reviewers.append(ChatGPTReviewer())
+            reviewers.append(ChatGPTReviewer(client=self.http_client))
         if models.get("gemini", {}).get("enabled", True):
             reviewers.append(GeminiReviewer())
         if models.get("codex", {}).get("enabled", True):
             reviewers.append(CodexReviewer())
         if models.get("qwen", {}).get("enabled", True):
-            reviewers.append(QWENReviewer())
+            reviewers.append(QWENReviewer(client=self.http_client))
         if models.get("claude", {}).get("enabled", True):
             reviewers.append(ClaudeReviewer())
         
+        if not self.use_cache:
+            for reviewer in reviewers:
+                reviewer.cache_dir = None
+        
         return reviewers
     
     async def review(self, spec_dir: Path, program_dir: Path, 
@@ -540,55 +988,111 @@ class MultiModelReviewOrchestrator:
         """Execute full multi-model review"""
         
         # 1. Collect artifacts
-        collector = SpecProgramTestCollector(spec_dir, program_dir, test_dir)
-        context = collector.collect()
+        collector = SpecProgramTestCollector(spec_dir, program_dir, test_dir,
+                                             io_concurrency=self.io_concurrency)
+        context = await collector.collect()
         
         # 2. Build review prompt
-        prompt = self._build_review_prompt(context)
+        prompt = PromptPayload.build(self._build_review_prompt(context))
         
-        # 3. Parallel review by all models
+        # 3. Parallel review by all models, 4. printing status as each finishes
         print("🔍 Starting parallel review by all models...")
-        tasks = [
-            reviewer.review(prompt, context) 
-            for reviewer in self.reviewers 
-            if reviewer.enabled
-        ]
-        all_findings = await asyncio.gather(*tasks)
+        all_findings = await self._run_reviews(prompt, context)
+        answered = [f for f in all_findings if "error" not in f]
+        # Distinct type:location findings; several models reporting the
+        # same issue still make one check
+        reported = len({
+            self.arbiter._issue_key(issue)
+            for f in answered for issue in f.get("findings", {}).get("issues", [])
+        })
         
-        # 4. Print model status
-        for finding in all_findings:
-            model = finding["model"]
-            if "error" in finding:
-                print(f"  ⚠️  {model}: {finding['error']}")
-            else:
-                issue_count = len(finding.get("findings", {}).get("issues", []))
-                print(f"  ✅ {model}: {issue_count} issues found")
-        
-        # 5. Claude filters false positives
-        print("\n🧠 Claude filtering false positives...")
-        issues = await self.arbiter.filter_false_positives(all_findings, context)
+        # 5. Claude filters false positives, unless there is nothing to filter
+        if not answered:
+            print("\n⚠️  No model completed a review")
+            issues = []
+        elif reported == 0:
+            issues = []
+        else:
+            print("\n🧠 Claude filtering false positives...")
+            review_config = self.config.get("review", {})
+            issues = await self.arbiter.filter_false_positives(
+                all_findings, context,
+                timeout=review_config.get("arbiter_timeout", 180),
+                hedge_after=review_config.get("arbiter_hedge_after", 30)
+            )
         
-        # 6. Build report
+        # 6. Build report: every distinct finding is one check, and those
+        # the arbiter or consensus dismissed count as passed
         report = ReviewReport(
             timestamp=datetime.now().isoformat(),
             spec_dir=str(spec_dir),
-            total_checks=len(self.reviewers) * 10,  # Approximate
+            total_checks=reported,
             passed=0,
             warnings=sum(1 for i in issues if i.severity == Severity.WARNING),
             errors=sum(1 for i in issues if i.severity == Severity.ERROR),
-            issues=issues
+            issues=issues,
+            reviewed_by=[f["model"] for f in answered]
         )
-        report.passed = report.total_checks - report.warnings - report.errors
+        report.passed = max(0, report.total_checks - report.warnings - report.errors)
         
         return report
     
+    async def _run_reviews(self, prompt: PromptPayload, context: Dict) -> List[Dict]:
+        """Run all enabled reviewers concurrently, reporting each as it completes
+        
+        With review.straggler_slack configured, once every other model has
+        answered the last one gets that many seconds before it is cancelled
+        and recorded as a timeout.
+        """
+        enabled = [r for r in self.reviewers if r.enabled]
+        tasks = {
+            asyncio.create_task(reviewer.review(prompt, context)): reviewer
+            for reviewer in enabled
+        }
+        slack = self.config.get("review", {}).get("straggler_slack")
+        
+        results: Dict[str, Dict] = {}
+        pending = set(tasks)
+        while pending:
+            timeout = slack if slack is not None and len(pending) == 1 and len(tasks) > 1 else None
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            
+            if not done:
+                for task in pending:
+                    task.cancel()
+                    name = tasks[task].name
+                    results[name] = {"model": name, "error": "timeout"}
+                    self._print_model_status(results[name])
+                break
+            
+            for task in done:
+                finding = task.result()
+                results[tasks[task].name] = finding
+                self._print_model_status(finding)
+        
+        # Keep reviewer order so consensus output is stable
+        return [results[r.name] for r in enabled]
+    
+    @staticmethod
+    def _print_model_status(finding: Dict):
+        model = finding["model"]
+        if "error" in finding:
+            print(f"  ⚠️  {model}: {finding['error']}")
+        else:
+            issue_count = len(finding.get("findings", {}).get("issues", []))
+            print(f"  ✅ {model}: {issue_count} issues found")
+    
     def _build_review_prompt(self, context: Dict) -> str:
-        spec_yaml = yaml.dump(context["spec"], default_flow_style=False, allow_unicode=True)
+        spec_yaml = yaml.dump(context["spec"], Dumper=SafeDumper,
+                              default_flow_style=False, allow_unicode=True)
         
         # Truncate if too long
         max_len = 50000
-        program_summary = str(context["program"])[:max_len]
-        test_summary = str(context["test"])[:max_len]
+        terms = self._relevance_terms(context["spec"])
+        program_summary = self._budgeted_files(context["program"], terms, max_len)
+        test_summary = self._budgeted_files(context["test"], terms, max_len)
         
         return f"""Review the following for Specification == Program == Test consistency:
 
@@ -609,12 +1113,54 @@ Key files:
 
 Identify any mismatches and report in JSON format.
 """
+    
+    @staticmethod
+    def _relevance_terms(specs: Dict) -> List[str]:
+        """Lower-cased aggregate and domain event names declared in the specs"""
+        terms = []
+        for spec in specs.values():
+            if not isinstance(spec, dict):
+                continue
+            aggregate = spec.get("aggregate")
+            if isinstance(aggregate, dict) and aggregate.get("name"):
+                terms.append(str(aggregate["name"]).lower())
+            events = spec.get("domain_events")
+            if isinstance(events, list):
+                terms.extend(
+                    str(e["name"]).lower() for e in events
+                    if isinstance(e, dict) and e.get("name")
+                )
+        return terms
+    
+    @staticmethod
+    def _budgeted_files(files: Dict[str, str], terms: List[str], budget: int) -> str:
+        """Render files as '### path' blocks until budget characters are used
+        
+        Files whose path mentions a spec term come first, so truncation drops
+        the least relevant content; nothing past the budget is formatted.
+        """
+        def relevance(path: str) -> int:
+            lowered = path.lower()
+            return sum(term in lowered for term in terms)
+        
+        parts = []
+        for path in sorted(files, key=lambda p: (-relevance(p), p)):
+            if budget <= 0:
+                break
+            header = f"### {path}\n"
+            content = files[path][:max(budget - len(header) - 1, 0)]
+            block = f"{header}{content}\n"
+            parts.append(block)
+            budget -= len(block)
+        return "".join(parts)
 
 
 def print_report(report: ReviewReport):
     """Print formatted review report"""
-    status = "✅ PASS" if report.errors == 0 and report.warnings == 0 else \
+    status = "⛔ NO REVIEW" if not report.reviewed_by else \
+             "✅ PASS" if report.errors == 0 and report.warnings == 0 else \
              "⚠️ CONDITIONAL PASS" if report.errors == 0 else "❌ FAILED"
+    reviewed_by = ", ".join(report.reviewed_by) or "none"
     
     print(f"""
 ╔═══════════════════════════════════════════════════════════════════╗
@@ -622,6 +1168,7 @@ def print_report(report: ReviewReport):
 ╠═══════════════════════════════════════════════════════════════════╣
 ║ Timestamp: {report.timestamp:<54} ║
 ║ Spec Dir:  {report.spec_dir:<54} ║
+║ Reviewed:  {reviewed_by:<54} ║
 ╠═══════════════════════════════════════════════════════════════════╣
 ║ Total Checks: {report.total_checks:<51} ║
 ║ Passed:       {report.passed:<51} ║
@@ -655,11 +1202,19 @@ async def main():
     parser.add_argument("--models", help="Comma-separated list of models to use")
     parser.add_argument("--check", choices=["all", "spec-program", "program-test", "test-spec"],
                        default="all", help="Which checks to run")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always query models instead of reusing cached responses")
+    parser.add_argument("--io-concurrency", type=int,
+                       default=os.environ.get("MMR_IO_CONCURRENCY"),
+                       help="Max files read concurrently (default: $MMR_IO_CONCURRENCY or 32)")
     
     args = parser.parse_args()
+    if args.io_concurrency is not None and args.io_concurrency < 1:
+        parser.error("--io-concurrency / MMR_IO_CONCURRENCY must be at least 1")
     
     config_path = Path(args.config) if args.config else None
-    orchestrator = MultiModelReviewOrchestrator(config_path)
+    orchestrator = MultiModelReviewOrchestrator(config_path, use_cache=not args.no_cache,
+                                                io_concurrency=args.io_concurrency)
     
     # Filter models if specified
     if args.models:
@@ -669,11 +1224,15 @@ async def main():
             if r.name in enabled_models
         ]
     
-    report = await orchestrator.review(
-        Path(args.spec_dir),
-        Path(args.program_dir),
-        Path(args.test_dir)
-    )
+    try:
+        report = await orchestrator.review(
+            Path(args.spec_dir),
+            Path(args.program_dir),
+            Path(args.test_dir)
+        )
+    finally:
+        await orchestrator.aclose()
+        _shutdown_process_pool()
     
     print_report(report)
     
@@ -687,6 +1246,7 @@ async def main():
                 "passed": report.passed,
                 "warnings": report.warnings,
                 "errors": report.errors,
+                "reviewed_by": report.reviewed_by,
                 "issues": [
                     {
                         "id": i.id,
@@ -699,12 +1259,17 @@ async def main():
                     }
                     for i in report.issues
                 ]
-            }, f, default_flow_style=False, allow_unicode=True)
+            }, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
         print(f"📄 Report saved to: {args.output}")
     
-    # Exit code based on errors
+    # Exit code based on errors; 2 when no model produced a review
+    if not report.reviewed_by:
+        sys.exit(2)
     sys.exit(1 if report.errors > 0 else 0)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())